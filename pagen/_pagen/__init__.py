@@ -51,7 +51,10 @@ from .mismatch import (
     MismatchLeaf as MismatchLeaf,
     MismatchTree as MismatchTree,
 )
-from .parsing import parse_grammar as parse_grammar
+from .parsing import (
+    clear_parse_grammar_cache as clear_parse_grammar_cache,
+    parse_grammar as parse_grammar,
+)
 from .rule import (
     LeftRecursiveRule as LeftRecursiveRule,
     NonLeftRecursiveRule as NonLeftRecursiveRule,
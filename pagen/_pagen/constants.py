@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 CHARACTER_CLASS_SPECIAL_CHARACTERS: Final[str] = '-[\\]^'
 COMMON_SPECIAL_CHARACTERS: Final[str] = 'fnrtv'
-COMMON_SPECIAL_CHARACTERS_TRANSLATION_TABLE: Final[Mapping[int, str]] = {
-    ord(('\\' + character).encode('utf-8').decode('unicode-escape')): (
-        '\\' + character
+COMMON_SPECIAL_CHARACTERS_TRANSLATION_TABLE: Final[Mapping[int, str]] = (
+    MappingProxyType(
+        {
+            ord(('\\' + character).encode('utf-8').decode('unicode-escape')): (
+                '\\' + character
+            )
+            for character in COMMON_SPECIAL_CHARACTERS
+        }
     )
-    for character in COMMON_SPECIAL_CHARACTERS
-}
+)
 DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTERS: Final[str] = '"\\'
 SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTERS: Final[str] = "'\\"
 
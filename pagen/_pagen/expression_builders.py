@@ -64,6 +64,7 @@ class ExpressionBuilder(ABC, Generic[MatchT_co, MismatchT_co]):
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -198,6 +199,7 @@ class AnyCharacterExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -288,6 +290,10 @@ class AnyCharacterExpressionBuilder(
 class CharacterClassExpressionBuilder(
     ExpressionBuilder[MatchLeaf, MismatchLeaf]
 ):
+    @property
+    def elements(self, /) -> Sequence[CharacterRange | CharacterSet]:
+        return self._elements
+
     @override
     def always_matches(
         self,
@@ -306,6 +312,7 @@ class CharacterClassExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -425,6 +432,7 @@ class ComplementedCharacterClassExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -556,6 +564,7 @@ class ExactRepetitionExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -570,15 +579,11 @@ class ExactRepetitionExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return ExactRepetitionExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            ),
-            self._count,
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return ExactRepetitionExpression(expression, self._count)
 
     @override
     def is_left_recursive(
@@ -714,6 +719,11 @@ class ExactRepetitionExpressionBuilder(
 
 
 class LiteralExpressionBuilder(ExpressionBuilder[MatchLeaf, MismatchLeaf]):
+    @property
+    @abstractmethod
+    def value(self, /) -> str:
+        raise NotImplementedError
+
     @override
     def always_matches(
         self,
@@ -798,11 +808,17 @@ class LiteralExpressionBuilder(ExpressionBuilder[MatchLeaf, MismatchLeaf]):
 
 @final
 class DoubleQuotedLiteralExpressionBuilder(LiteralExpressionBuilder):
+    @property
+    @override
+    def value(self, /) -> str:
+        return self._value
+
     @override
     def build(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -834,11 +850,17 @@ class DoubleQuotedLiteralExpressionBuilder(LiteralExpressionBuilder):
 
 @final
 class SingleQuotedLiteralExpressionBuilder(LiteralExpressionBuilder):
+    @property
+    @override
+    def value(self, /) -> str:
+        return self._value
+
     @override
     def build(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -901,6 +923,7 @@ class NegativeLookaheadExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -915,14 +938,11 @@ class NegativeLookaheadExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return NegativeLookaheadExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            )
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return NegativeLookaheadExpression(expression)
 
     @override
     def is_left_recursive(
@@ -1077,6 +1097,7 @@ class OneOrMoreExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -1091,14 +1112,11 @@ class OneOrMoreExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return OneOrMoreExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            )
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return OneOrMoreExpression(expression)
 
     @override
     def is_left_recursive(
@@ -1250,6 +1268,7 @@ class OptionalExpressionBuilder(ExpressionBuilder[AnyMatch, AnyMismatch]):
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -1264,14 +1283,11 @@ class OptionalExpressionBuilder(ExpressionBuilder[AnyMatch, AnyMismatch]):
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return OptionalExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            )
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return OptionalExpression(expression)
 
     @override
     def is_left_recursive(
@@ -1443,6 +1459,7 @@ class PositiveLookaheadExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -1457,14 +1474,11 @@ class PositiveLookaheadExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return PositiveLookaheadExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            )
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return PositiveLookaheadExpression(expression)
 
     @override
     def is_left_recursive(
@@ -1620,6 +1634,7 @@ class PositiveOrMoreExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -1634,15 +1649,11 @@ class PositiveOrMoreExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return PositiveOrMoreExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            ),
-            self._start,
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return PositiveOrMoreExpression(expression, self._start)
 
     @override
     def is_left_recursive(
@@ -1814,6 +1825,7 @@ class PositiveRepetitionRangeExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -1828,15 +1840,12 @@ class PositiveRepetitionRangeExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
         return PositiveRepetitionRangeExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            ),
-            self._start,
-            self._end,
+            expression, self._start, self._end
         )
 
     @override
@@ -2030,10 +2039,14 @@ class PrioritizedChoiceExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
         rule_expression_builder_indices: Sequence[int],
+        variant_first_characters: (
+            Sequence[frozenset[str] | None] | None
+        ) = None,
     ) -> PrioritizedChoiceExpression:
         variant_builders = [
             expression_builders[variant_builder_index]
@@ -2060,16 +2073,13 @@ class PrioritizedChoiceExpressionBuilder(
                 'should not be always matching, '
                 f'but got: {", ".join(map(repr, always_matching_variants))}.'
             )
+        variants: list[Expression[AnyMatch, AnyMismatch]] = []
+        for variant_builder_index in self._variant_builder_indices:
+            variant = built_expressions[variant_builder_index]
+            assert variant is not None, variant_builder_index
+            variants.append(variant)
         return PrioritizedChoiceExpression(
-            [
-                variant_builder.build(
-                    expression_builders=expression_builders,
-                    rule_expression_builder_indices=(
-                        rule_expression_builder_indices
-                    ),
-                )
-                for variant_builder in variant_builders
-            ]
+            variants, variant_first_characters=variant_first_characters
         )
 
     @override
@@ -2140,7 +2150,7 @@ class PrioritizedChoiceExpressionBuilder(
             for variant_builder_index in self._variant_builder_indices
         )
 
-    _variant_builder_indices: Sequence[int]
+    _variant_builder_indices: tuple[int, ...]
 
     @override
     def _to_match_classes_impl(
@@ -2217,7 +2227,7 @@ class PrioritizedChoiceExpressionBuilder(
         ):
             raise ValueError(invalid_value_variant_builder_indices)
         self = super().__new__(cls)
-        self._variant_builder_indices = variant_builder_indices
+        self._variant_builder_indices = tuple(variant_builder_indices)
         return self
 
     @override
@@ -2227,6 +2237,10 @@ class PrioritizedChoiceExpressionBuilder(
 
 @final
 class RuleReferenceBuilder(ExpressionBuilder[RuleMatch, AnyMismatch]):
+    @property
+    def index(self, /) -> int:
+        return self._index
+
     @override
     def always_matches(
         self,
@@ -2257,6 +2271,7 @@ class RuleReferenceBuilder(ExpressionBuilder[RuleMatch, AnyMismatch]):
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -2475,6 +2490,7 @@ class SequenceExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -2499,17 +2515,12 @@ class SequenceExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
                 'at least one non-nullable element builder, '
                 f'but got: {", ".join(map(repr, element_builders))}.'
             )
-        return SequenceExpression(
-            [
-                element_builder.build(
-                    expression_builders=expression_builders,
-                    rule_expression_builder_indices=(
-                        rule_expression_builder_indices
-                    ),
-                )
-                for element_builder in element_builders
-            ]
-        )
+        elements: list[Expression[AnyMatch, AnyMismatch]] = []
+        for element_builder_index in self._element_builder_indices:
+            element = built_expressions[element_builder_index]
+            assert element is not None, element_builder_index
+            elements.append(element)
+        return SequenceExpression(elements)
 
     @override
     def is_left_recursive(
@@ -2593,7 +2604,7 @@ class SequenceExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
             for element_builder_index in self._element_builder_indices[1:]
         )
 
-    _element_builder_indices: Sequence[int]
+    _element_builder_indices: tuple[int, ...]
 
     @override
     def _to_match_classes_impl(
@@ -2661,7 +2672,7 @@ class SequenceExpressionBuilder(ExpressionBuilder[MatchTree, MismatchTree]):
         ):
             raise ValueError(invalid_value_element_builder_indices)
         self = super().__new__(cls)
-        self._element_builder_indices = element_builder_indices
+        self._element_builder_indices = tuple(element_builder_indices)
         return self
 
     @override
@@ -2695,6 +2706,7 @@ class ZeroOrMoreExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -2709,14 +2721,11 @@ class ZeroOrMoreExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return ZeroOrMoreExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            )
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return ZeroOrMoreExpression(expression)
 
     @override
     def is_left_recursive(
@@ -2873,6 +2882,7 @@ class ZeroRepetitionRangeExpressionBuilder(
         self,
         /,
         *,
+        built_expressions: Sequence[Expression[AnyMatch, AnyMismatch] | None],
         expression_builders: Sequence[
             ExpressionBuilder[AnyMatch, AnyMismatch]
         ],
@@ -2887,15 +2897,11 @@ class ZeroRepetitionRangeExpressionBuilder(
             expression_builders=expression_builders,
             rule_expression_builder_indices=rule_expression_builder_indices,
         )
-        return ZeroRepetitionRangeExpression(
-            expression_builder.build(
-                expression_builders=expression_builders,
-                rule_expression_builder_indices=(
-                    rule_expression_builder_indices
-                ),
-            ),
-            self._end,
-        )
+        expression = built_expressions[self._expression_builder_index]
+        assert _is_built_expression(
+            expression, expected_match_cls=MatchTreeChild
+        ), expression
+        return ZeroRepetitionRangeExpression(expression, self._end)
 
     @override
     def is_left_recursive(
@@ -3052,6 +3058,18 @@ def _check_that_expression_builder_is_progressing(
         )
 
 
+def _is_built_expression(
+    value: Expression[AnyMatch, AnyMismatch] | None,
+    /,
+    *,
+    expected_match_cls: type[MatchT_co] | UnionType,
+) -> TypeGuard[Expression[MatchT_co, AnyMismatch]]:
+    return value is not None and all(
+        issubclass(match_cls, expected_match_cls)
+        for match_cls in value.to_match_classes()
+    )
+
+
 def _is_expression_builder(
     value: ExpressionBuilder[AnyMatch, AnyMismatch],
     /,
@@ -9,6 +9,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
+    Final,
     Generic,
     TypeAlias,
     TypeGuard,
@@ -302,7 +303,12 @@ class CharacterClassExpression(Expression[MatchLeaf, MismatchLeaf]):
         character = text[index]
         return (
             EvaluationSuccess(MatchLeaf(characters=character), None)
-            if any(character in element for element in self._elements)
+            if (
+                self._bitmap[character_code]
+                if (character_code := ord(character))
+                < _BITMAP_CHARACTERS_COUNT
+                else any(character in element for element in self._elements)
+            )
             else EvaluationFailure(
                 MismatchLeaf(
                     str(self),
@@ -335,9 +341,10 @@ class CharacterClassExpression(Expression[MatchLeaf, MismatchLeaf]):
             )
         )
 
+    _bitmap: bytes
     _elements: Sequence[CharacterRange | CharacterSet]
 
-    __slots__ = ('_elements',)
+    __slots__ = '_bitmap', '_elements'
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -356,6 +363,7 @@ class CharacterClassExpression(Expression[MatchLeaf, MismatchLeaf]):
             )
         self = super().__new__(cls)
         self._elements = merge_consecutive_character_sets(elements)
+        self._bitmap = _to_character_bitmap(self._elements)
         return self
 
     @overload
@@ -412,7 +420,14 @@ class ComplementedCharacterClassExpression(
         character = text[index]
         return (
             EvaluationSuccess(MatchLeaf(characters=character), None)
-            if all(character not in element for element in self._elements)
+            if (
+                self._bitmap[character_code]
+                if (character_code := ord(character))
+                < _BITMAP_CHARACTERS_COUNT
+                else all(
+                    character not in element for element in self._elements
+                )
+            )
             else EvaluationFailure(
                 MismatchLeaf(
                     str(self),
@@ -445,9 +460,10 @@ class ComplementedCharacterClassExpression(
             )
         )
 
+    _bitmap: bytes
     _elements: Sequence[CharacterRange | CharacterSet]
 
-    __slots__ = ('_elements',)
+    __slots__ = '_bitmap', '_elements'
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -466,6 +482,9 @@ class ComplementedCharacterClassExpression(
             )
         self = super().__new__(cls)
         self._elements = merge_consecutive_character_sets(elements)
+        self._bitmap = bytes(
+            not flag for flag in _to_character_bitmap(self._elements)
+        )
         return self
 
     @overload
@@ -1472,13 +1491,36 @@ class PrioritizedChoiceExpression(Expression[AnyMatch, AnyMismatch]):
     def evaluate(
         self, text: str, index: int, /, *, rules: Sequence[Rule]
     ) -> EvaluationResult[AnyMatch, AnyMismatch]:
-        variant_mismatches: list[AnyMismatch] = []
-        for variant in self._variants:
-            variant_result = variant.evaluate(text, index, rules=rules)
+        variants = self._variants
+        candidate_variant_mismatches: dict[int, AnyMismatch] = {}
+        for variant_index in (
+            self._first_character_variant_indices.get(
+                text[index], self._default_variant_indices
+            )
+            if index < len(text)
+            else self._default_variant_indices
+        ):
+            variant_result = variants[variant_index].evaluate(
+                text, index, rules=rules
+            )
             if is_success(variant_result):
                 return variant_result
-            else:
-                variant_mismatches.append(variant_result.mismatch)
+            candidate_variant_mismatches[variant_index] = (
+                variant_result.mismatch
+            )
+        # a failure reports a mismatch for every variant,
+        # so the variants skipped by dispatch are still evaluated here
+        variant_mismatches: list[AnyMismatch] = []
+        for variant_index, variant in enumerate(variants):
+            if (
+                variant_mismatch := candidate_variant_mismatches.get(
+                    variant_index
+                )
+            ) is None:
+                variant_result = variant.evaluate(text, index, rules=rules)
+                assert is_failure(variant_result), variant_result
+                variant_mismatch = variant_result.mismatch
+            variant_mismatches.append(variant_mismatch)
         return EvaluationFailure(
             MismatchTree(str(self), children=variant_mismatches)
         )
@@ -1517,9 +1559,15 @@ class PrioritizedChoiceExpression(Expression[AnyMatch, AnyMismatch]):
             )
         )
 
+    _default_variant_indices: tuple[int, ...]
+    _first_character_variant_indices: dict[str, tuple[int, ...]]
     _variants: Sequence[Expression[AnyMatch, AnyMismatch]]
 
-    __slots__ = ('_variants',)
+    __slots__ = (
+        '_default_variant_indices',
+        '_first_character_variant_indices',
+        '_variants',
+    )
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -1528,11 +1576,51 @@ class PrioritizedChoiceExpression(Expression[AnyMatch, AnyMismatch]):
         )
 
     def __new__(
-        cls, variants: Sequence[Expression[AnyMatch, AnyMismatch]], /
+        cls,
+        variants: Sequence[Expression[AnyMatch, AnyMismatch]],
+        /,
+        *,
+        variant_first_characters: Sequence[frozenset[str] | None]
+        | None = None,
     ) -> Self:
         assert len(variants) > 1, variants
+        if variant_first_characters is None:
+            variant_first_characters = [None] * len(variants)
+        assert len(variant_first_characters) == len(variants), (
+            variant_first_characters
+        )
         self = super().__new__(cls)
-        self._variants = variants
+        (
+            self._default_variant_indices,
+            self._first_character_variant_indices,
+            self._variants,
+        ) = (
+            tuple(
+                variant_index
+                for variant_index, first_characters in enumerate(
+                    variant_first_characters
+                )
+                if first_characters is None
+            ),
+            {
+                character: tuple(
+                    variant_index
+                    for variant_index, first_characters in enumerate(
+                        variant_first_characters
+                    )
+                    if first_characters is None
+                    or character in first_characters
+                )
+                for character in frozenset[str]().union(
+                    *[
+                        first_characters
+                        for first_characters in variant_first_characters
+                        if first_characters is not None
+                    ]
+                )
+            },
+            variants,
+        )
         return self
 
     @overload
@@ -2076,6 +2164,9 @@ def is_success(value: Any, /) -> TypeIs[EvaluationSuccess[Any, Any]]:
     return isinstance(value, EvaluationSuccess)
 
 
+_BITMAP_CHARACTERS_COUNT: Final[int] = 256
+
+
 def _escape_double_quoted_literal_characters(
     value: str,
     /,
@@ -2123,6 +2214,15 @@ def _is_progressing_expression(
     )
 
 
+def _to_character_bitmap(
+    elements: Sequence[CharacterRange | CharacterSet], /
+) -> bytes:
+    return bytes(
+        any(character in element for element in elements)
+        for character in map(chr, range(_BITMAP_CHARACTERS_COUNT))
+    )
+
+
 def _to_nested_expression_str(
     value: Expression[Any, Any], /, *, parent_precedence: int
 ) -> str:
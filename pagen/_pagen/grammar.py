@@ -92,8 +92,8 @@ class Grammar:
         return match
 
     _line_separator: str | None
-    _rule_builders: Sequence[RuleBuilder]
-    _rule_names: Sequence[str]
+    _rule_builders: tuple[RuleBuilder, ...]
+    _rule_names: tuple[str, ...]
 
     __slots__ = '_line_separator', '_rule_builders', '_rule_names'
 
@@ -122,8 +122,8 @@ class Grammar:
         self = super().__new__(cls)
         self._line_separator, self._rule_builders, self._rule_names = (
             line_separator,
-            rule_builders,
-            rule_names,
+            tuple(rule_builders),
+            tuple(rule_names),
         )
         return self
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from functools import singledispatch
-from typing import TypeGuard, TypeVar
+from collections.abc import Callable, Mapping, Sequence
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import Any, Final, TypeGuard, TypeVar
 
 from typing_extensions import override
 
@@ -14,6 +15,7 @@ from .expression_builders import (
     DoubleQuotedLiteralExpressionBuilder,
     ExactRepetitionExpressionBuilder,
     ExpressionBuilder,
+    LiteralExpressionBuilder,
     NegativeLookaheadExpressionBuilder,
     OneOrMoreExpressionBuilder,
     OptionalExpressionBuilder,
@@ -27,10 +29,16 @@ from .expression_builders import (
     ZeroOrMoreExpressionBuilder,
     ZeroRepetitionRangeExpressionBuilder,
 )
+from .expressions import Expression
 from .grammar import Grammar
 from .match import AnyMatch
 from .mismatch import AnyMismatch
-from .rule import LeftRecursiveRuleBuilder, NonLeftRecursiveRuleBuilder
+from .rule import (
+    LeftRecursiveRuleBuilder,
+    NonLeftRecursiveRuleBuilder,
+    RuleBuilder,
+)
+from .utils import to_package_non_abstract_subclasses
 
 
 class GrammarBuilder:
@@ -41,20 +49,16 @@ class GrammarBuilder:
     def add_rule(
         self, rule_name: str, rule_expression_builder_index: int, /
     ) -> None:
-        rule_expression_builder_index_range = range(
-            len(self._expression_builders)
-        )
-        if (
-            rule_expression_builder_index
-            not in rule_expression_builder_index_range
+        expression_builders_count = len(self._expression_builders)
+        if not (
+            0 <= rule_expression_builder_index < expression_builders_count
         ):
             raise ValueError(
                 'Expression builder index is out of range: '
                 f'{rule_expression_builder_index!r} is not '
-                f'in {rule_expression_builder_index_range!r}.'
+                f'in {range(expression_builders_count)!r}.'
             )
-        if rule_name in self._rule_names:
-            rule_index = self._rule_names.index(rule_name)
+        if (rule_index := self._rule_name_to_index.get(rule_name)) is not None:
             if (
                 existing_expression_builder_index := (
                     self._rule_expression_builder_indices[rule_index]
@@ -79,6 +83,7 @@ class GrammarBuilder:
             assert len(self._rule_names) == len(
                 self._rule_expression_builder_indices
             ), self
+            self._rule_name_to_index[rule_name] = len(self._rule_names)
             self._rule_names.append(rule_name)
             self._rule_expression_builder_indices.append(
                 rule_expression_builder_index
@@ -90,8 +95,7 @@ class GrammarBuilder:
         )
 
     def build(self, /) -> Grammar:
-        self._validate()
-        return self._build()
+        return self._build(self._validate())
 
     def character_class_expression(
         self, elements: Sequence[CharacterRange | CharacterSet], /
@@ -108,8 +112,8 @@ class GrammarBuilder:
         )
 
     def double_quoted_literal_expression(self, value: str, /) -> int:
-        return self._register_expression_builder(
-            DoubleQuotedLiteralExpressionBuilder(value)
+        return self._register_literal_expression_builder(
+            DoubleQuotedLiteralExpressionBuilder, value
         )
 
     def exact_repetition_expression(
@@ -167,18 +171,24 @@ class GrammarBuilder:
         )
 
     def rule_reference(self, rule_name: str, /) -> int:
-        if rule_name in self._rule_names:
-            rule_index = self._rule_names.index(rule_name)
-        else:
-            rule_index = len(self._rule_names)
+        if (rule_index := self._rule_name_to_index.get(rule_name)) is None:
+            rule_index = self._rule_name_to_index[rule_name] = len(
+                self._rule_names
+            )
             assert len(self._rule_names) == len(
                 self._rule_expression_builder_indices
             ), self
             self._rule_names.append(rule_name)
             self._rule_expression_builder_indices.append(None)
-        return self._register_expression_builder(
-            RuleReferenceBuilder(rule_name, rule_index)
-        )
+        if (
+            result := self._rule_reference_builder_indices.get(rule_index)
+        ) is None:
+            result = self._rule_reference_builder_indices[rule_index] = (
+                self._register_expression_builder(
+                    RuleReferenceBuilder(rule_name, rule_index)
+                )
+            )
+        return result
 
     def sequence_expression(
         self, element_builder_indices: Sequence[int], /
@@ -188,8 +198,8 @@ class GrammarBuilder:
         )
 
     def single_quoted_literal_expression(self, value: str, /) -> int:
-        return self._register_expression_builder(
-            SingleQuotedLiteralExpressionBuilder(value)
+        return self._register_literal_expression_builder(
+            SingleQuotedLiteralExpressionBuilder, value
         )
 
     def zero_or_more_expression(self, expression_builder_index: int, /) -> int:
@@ -205,44 +215,109 @@ class GrammarBuilder:
         )
 
     _expression_builders: list[ExpressionBuilder[AnyMatch, AnyMismatch]]
+    _literal_expression_builder_indices: dict[
+        tuple[type[LiteralExpressionBuilder], str], int
+    ]
+    _rule_name_to_index: dict[str, int]
     _rule_names: list[str]
     _rule_expression_builder_indices: list[int | None]
-
-    def _build(self, /) -> Grammar:
-        rule_expression_builder_indices = (
-            self._get_validated_rule_expression_builder_indices()
-        )
-        return Grammar(
-            self._rule_names,
-            [
-                (
-                    LeftRecursiveRuleBuilder
-                    if (
-                        rule_expression_builder := self._expression_builders[
-                            rule_expression_builder_index
-                        ]
-                    ).is_left_recursive(
+    _rule_reference_builder_indices: dict[int, int]
+
+    def _build(
+        self, rule_expression_builder_indices: Sequence[int], /
+    ) -> Grammar:
+        built_expressions: list[Expression[AnyMatch, AnyMismatch] | None] = [
+            None
+        ] * len(self._expression_builders)
+        first_characters_cache: dict[int, frozenset[str] | None] = {}
+        for expression_builder_index in self._topological_order():
+            expression_builder = self._expression_builders[
+                expression_builder_index
+            ]
+            if isinstance(
+                expression_builder, PrioritizedChoiceExpressionBuilder
+            ):
+                built_expressions[expression_builder_index] = (
+                    expression_builder.build(
+                        built_expressions=built_expressions,
                         expression_builders=self._expression_builders,
                         rule_expression_builder_indices=(
                             rule_expression_builder_indices
                         ),
-                        visited_rule_indices=set(),
+                        variant_first_characters=[
+                            (
+                                None
+                                if self._expression_builders[
+                                    variant_builder_index
+                                ].is_nullable(
+                                    expression_builders=(
+                                        self._expression_builders
+                                    ),
+                                    rule_expression_builder_indices=(
+                                        rule_expression_builder_indices
+                                    ),
+                                    visited_rule_indices=set(),
+                                )
+                                else _to_first_characters(
+                                    variant_builder_index,
+                                    expression_builders=(
+                                        self._expression_builders
+                                    ),
+                                    first_characters_cache=(
+                                        first_characters_cache
+                                    ),
+                                    rule_expression_builder_indices=(
+                                        rule_expression_builder_indices
+                                    ),
+                                    visited_rule_indices=set(),
+                                )
+                            )
+                            for variant_builder_index in (
+                                expression_builder.variant_builder_indices
+                            )
+                        ],
                     )
-                    else NonLeftRecursiveRuleBuilder
-                )(
-                    self._rule_names[rule_index],
-                    rule_expression_builder.build(
+                )
+            else:
+                built_expressions[expression_builder_index] = (
+                    expression_builder.build(
+                        built_expressions=built_expressions,
                         expression_builders=self._expression_builders,
                         rule_expression_builder_indices=(
                             rule_expression_builder_indices
                         ),
-                    ),
+                    )
                 )
-                for (rule_index, rule_expression_builder_index) in enumerate(
-                    rule_expression_builder_indices
+        assert _is_non_none_sequence(built_expressions), built_expressions
+        is_left_recursive_cache: dict[int, bool] = {}
+        rule_builders: list[RuleBuilder] = []
+        for rule_name, rule_expression_builder_index in zip(
+            self._rule_names, rule_expression_builder_indices, strict=True
+        ):
+            if (
+                is_left_recursive := is_left_recursive_cache.get(
+                    rule_expression_builder_index
                 )
-            ],
-        )
+            ) is None:
+                is_left_recursive = is_left_recursive_cache[
+                    rule_expression_builder_index
+                ] = self._expression_builders[
+                    rule_expression_builder_index
+                ].is_left_recursive(
+                    expression_builders=self._expression_builders,
+                    rule_expression_builder_indices=(
+                        rule_expression_builder_indices
+                    ),
+                    visited_rule_indices=set(),
+                )
+            rule_builders.append(
+                (
+                    LeftRecursiveRuleBuilder
+                    if is_left_recursive
+                    else NonLeftRecursiveRuleBuilder
+                )(rule_name, built_expressions[rule_expression_builder_index])
+            )
+        return Grammar(self._rule_names, rule_builders)
 
     def _get_validated_rule_expression_builder_indices(
         self, /
@@ -269,55 +344,106 @@ class GrammarBuilder:
         self._expression_builders.append(expression_builder)
         return result
 
-    def _validate(self, /) -> None:
+    def _register_literal_expression_builder(
+        self, cls: type[LiteralExpressionBuilder], value: str, /
+    ) -> int:
+        key = (cls, value)
+        if (
+            result := self._literal_expression_builder_indices.get(key)
+        ) is None:
+            result = self._literal_expression_builder_indices[key] = (
+                self._register_expression_builder(cls(value))
+            )
+        return result
+
+    def _topological_order(self, /) -> list[int]:
+        result: list[int] = []
+        states = [_VisitState.UNVISITED] * len(self._expression_builders)
+        for root_index in range(len(self._expression_builders)):
+            if states[root_index] is not _VisitState.UNVISITED:
+                continue
+            stack = [(root_index, False)]
+            while stack:
+                index, are_children_ordered = stack.pop()
+                if are_children_ordered:
+                    states[index] = _VisitState.ORDERED
+                    result.append(index)
+                    continue
+                state = states[index]
+                if state is _VisitState.ORDERED:
+                    continue
+                if state is _VisitState.IN_PROGRESS:
+                    raise ValueError(
+                        'Expression builders should not form cycles, '
+                        f'but got one through '
+                        f'{self._expression_builders[index]!r}.'
+                    )
+                states[index] = _VisitState.IN_PROGRESS
+                stack.append((index, True))
+                stack.extend(
+                    (child_index, False)
+                    for child_index in _to_child_expression_builder_indices(
+                        self._expression_builders[index]
+                    )
+                    if states[child_index] is not _VisitState.ORDERED
+                )
+        return result
+
+    def _validate(self, /) -> Sequence[int]:
         assert len(self._rule_names) == len(
             self._rule_expression_builder_indices
         ), self
         rule_expression_builder_indices = (
             self._get_validated_rule_expression_builder_indices()
         )
-        if (
-            len(
-                non_terminating_rule_names := [
-                    self._rule_names[rule_index]
-                    for rule_index, rule_expression_builder_index in enumerate(
-                        rule_expression_builder_indices
-                    )
-                    if not self._expression_builders[
-                        rule_expression_builder_index
-                    ].is_terminating(
-                        expression_builders=self._expression_builders,
-                        is_leftmost=True,
-                        rule_expression_builder_indices=(
-                            rule_expression_builder_indices
-                        ),
-                        visited_rule_indices=set(),
-                    )
-                ]
-            )
-            > 0
+        is_terminating_cache: dict[int, bool] = {}
+        non_terminating_rule_names: list[str] = []
+        for rule_name, rule_expression_builder_index in zip(
+            self._rule_names, rule_expression_builder_indices, strict=True
         ):
+            if (
+                is_terminating := is_terminating_cache.get(
+                    rule_expression_builder_index
+                )
+            ) is None:
+                is_terminating = is_terminating_cache[
+                    rule_expression_builder_index
+                ] = self._expression_builders[
+                    rule_expression_builder_index
+                ].is_terminating(
+                    expression_builders=self._expression_builders,
+                    is_leftmost=True,
+                    rule_expression_builder_indices=(
+                        rule_expression_builder_indices
+                    ),
+                    visited_rule_indices=set(),
+                )
+            if not is_terminating:
+                non_terminating_rule_names.append(rule_name)
+        if len(non_terminating_rule_names) > 0:
             non_terminating_rule_names.sort()
             raise ValueError(
                 'All rules should be terminating, '
                 'but the following ones are not: '
                 f'{", ".join(map(repr, non_terminating_rule_names))}.'
             )
-        used_expression_builder_indices = [False] * len(
-            self._expression_builders
+        used_expression_builder_indices = bytearray(
+            len(self._expression_builders)
         )
-        for rule_expression_builder_index in rule_expression_builder_indices:
-            used_expression_builder_indices[rule_expression_builder_index] = (
-                True
-            )
-            _walk_expression_builder(
-                self._expression_builders[rule_expression_builder_index],
-                expression_builders=self._expression_builders,
-                used_expression_builder_indices=(
-                    used_expression_builder_indices
-                ),
+        expression_builder_indices_stack = list(
+            rule_expression_builder_indices
+        )
+        while expression_builder_indices_stack:
+            expression_builder_index = expression_builder_indices_stack.pop()
+            if used_expression_builder_indices[expression_builder_index]:
+                continue
+            used_expression_builder_indices[expression_builder_index] = 1
+            expression_builder_indices_stack.extend(
+                _to_child_expression_builder_indices(
+                    self._expression_builders[expression_builder_index]
+                )
             )
-        if not all(used_expression_builder_indices):
+        if used_expression_builder_indices.find(0) != -1:
             unused_expression_builders = [
                 self._expression_builders[index]
                 for index, used in enumerate(used_expression_builder_indices)
@@ -327,11 +453,15 @@ class GrammarBuilder:
                 'All expression builders should be used in rules, '
                 f'but got: {unused_expression_builders!r}.'
             )
+        return rule_expression_builder_indices
 
     __slots__ = (
         '_expression_builders',
+        '_literal_expression_builder_indices',
         '_rule_expression_builder_indices',
+        '_rule_name_to_index',
         '_rule_names',
+        '_rule_reference_builder_indices',
     )
 
     def __init__(
@@ -345,11 +475,31 @@ class GrammarBuilder:
     ) -> None:
         if not isinstance(expression_builders, list | None):
             raise TypeError(type(expression_builders))
-        if not isinstance(rule_expression_indices, dict | None):
+        if not isinstance(rule_names, list | None):
+            raise TypeError(type(rule_names))
+        if not isinstance(rule_expression_indices, list | None):
             raise TypeError(type(rule_expression_indices))
         self._expression_builders = expression_builders or []
+        self._literal_expression_builder_indices = {
+            (type(expression_builder), expression_builder.value): index
+            for index, expression_builder in enumerate(
+                self._expression_builders
+            )
+            if isinstance(expression_builder, LiteralExpressionBuilder)
+        }
         self._rule_names = rule_names or []
+        self._rule_name_to_index = {
+            rule_name: rule_index
+            for rule_index, rule_name in enumerate(self._rule_names)
+        }
         self._rule_expression_builder_indices = rule_expression_indices or []
+        self._rule_reference_builder_indices = {
+            expression_builder.index: index
+            for index, expression_builder in enumerate(
+                self._expression_builders
+            )
+            if isinstance(expression_builder, RuleReferenceBuilder)
+        }
 
     @override
     def __repr__(self, /) -> str:
@@ -362,34 +512,135 @@ class GrammarBuilder:
         )
 
 
+_MAX_FIRST_CHARACTERS_COUNT: Final[int] = 256
+
 _T = TypeVar('_T')
 
 
+class _VisitState(Enum):
+    UNVISITED = auto()
+    IN_PROGRESS = auto()
+    ORDERED = auto()
+
+
 def _is_non_none_sequence(
     value: Sequence[_T | None], /
 ) -> TypeGuard[Sequence[_T]]:
-    return all(element is not None for element in value)
+    return None not in value
 
 
-@singledispatch
-def _walk_expression_builder(
-    expression_builder: ExpressionBuilder[AnyMatch, AnyMismatch],
+def _to_child_expression_builder_indices(
+    expression_builder: ExpressionBuilder[AnyMatch, AnyMismatch], /
+) -> Sequence[int]:
+    try:
+        getter = _CHILD_EXPRESSION_BUILDER_INDICES_GETTERS[
+            type(expression_builder)
+        ]
+    except KeyError:
+        raise TypeError(type(expression_builder)) from None
+    return getter(expression_builder)
+
+
+def _to_first_characters(
+    expression_builder_index: int,
     /,
     *,
     expression_builders: Sequence[ExpressionBuilder[AnyMatch, AnyMismatch]],
-    used_expression_builder_indices: list[bool],
-) -> None:
-    raise TypeError(type(expression_builder))
-
-
-@_walk_expression_builder.register(AnyCharacterExpressionBuilder)
-@_walk_expression_builder.register(CharacterClassExpressionBuilder)
-@_walk_expression_builder.register(ComplementedCharacterClassExpressionBuilder)
-@_walk_expression_builder.register(DoubleQuotedLiteralExpressionBuilder)
-@_walk_expression_builder.register(RuleReferenceBuilder)
-@_walk_expression_builder.register(SingleQuotedLiteralExpressionBuilder)
-def _(
-    expression_builder: (
+    first_characters_cache: dict[int, frozenset[str] | None],
+    rule_expression_builder_indices: Sequence[int],
+    visited_rule_indices: set[int],
+) -> frozenset[str] | None:
+    expression_builder = expression_builders[expression_builder_index]
+    if isinstance(expression_builder, LiteralExpressionBuilder):
+        return frozenset((expression_builder.value[0],))
+    if isinstance(expression_builder, CharacterClassExpressionBuilder):
+        characters: set[str] = set()
+        for element in expression_builder.elements:
+            if isinstance(element, CharacterRange):
+                start_code_point, end_code_point = (
+                    ord(element.start),
+                    ord(element.end),
+                )
+                if (
+                    end_code_point - start_code_point
+                    >= _MAX_FIRST_CHARACTERS_COUNT
+                ):
+                    return None
+                characters.update(
+                    map(chr, range(start_code_point, end_code_point + 1))
+                )
+            else:
+                characters.update(element.elements)
+        return (
+            None
+            if len(characters) > _MAX_FIRST_CHARACTERS_COUNT
+            else frozenset(characters)
+        )
+    if isinstance(
+        expression_builder,
+        NegativeLookaheadExpressionBuilder
+        | PositiveLookaheadExpressionBuilder,
+    ):
+        return frozenset()
+    if isinstance(expression_builder, RuleReferenceBuilder):
+        if expression_builder.index in visited_rule_indices:
+            return None
+        rule_expression_builder_index = rule_expression_builder_indices[
+            expression_builder.index
+        ]
+        if rule_expression_builder_index not in first_characters_cache:
+            visited_rule_indices.add(expression_builder.index)
+            first_characters_cache[rule_expression_builder_index] = (
+                _to_first_characters(
+                    rule_expression_builder_index,
+                    expression_builders=expression_builders,
+                    first_characters_cache=first_characters_cache,
+                    rule_expression_builder_indices=(
+                        rule_expression_builder_indices
+                    ),
+                    visited_rule_indices=visited_rule_indices,
+                )
+            )
+            visited_rule_indices.remove(expression_builder.index)
+        return first_characters_cache[rule_expression_builder_index]
+    if isinstance(
+        expression_builder,
+        AnyCharacterExpressionBuilder
+        | ComplementedCharacterClassExpressionBuilder,
+    ):
+        return None
+    result: set[str] = set()
+    for child_expression_builder_index in _to_child_expression_builder_indices(
+        expression_builder
+    ):
+        if (
+            child_first_characters := _to_first_characters(
+                child_expression_builder_index,
+                expression_builders=expression_builders,
+                first_characters_cache=first_characters_cache,
+                rule_expression_builder_indices=(
+                    rule_expression_builder_indices
+                ),
+                visited_rule_indices=visited_rule_indices,
+            )
+        ) is None:
+            return None
+        result.update(child_first_characters)
+        if isinstance(
+            expression_builder, SequenceExpressionBuilder
+        ) and not expression_builders[
+            child_expression_builder_index
+        ].is_nullable(
+            expression_builders=expression_builders,
+            rule_expression_builder_indices=rule_expression_builder_indices,
+            visited_rule_indices=set(),
+        ):
+            break
+    return frozenset(result)
+
+
+def _to_leaf_child_expression_builder_indices(
+    _expression_builder: (
         AnyCharacterExpressionBuilder
         | CharacterClassExpressionBuilder
         | ComplementedCharacterClassExpressionBuilder
@@ -398,23 +649,23 @@ def _(
         | SingleQuotedLiteralExpressionBuilder
     ),
     /,
-    *,
-    expression_builders: Sequence[ExpressionBuilder[AnyMatch, AnyMismatch]],
-    used_expression_builder_indices: list[bool],
-) -> None:
-    return
-
-
-@_walk_expression_builder.register(ExactRepetitionExpressionBuilder)
-@_walk_expression_builder.register(NegativeLookaheadExpressionBuilder)
-@_walk_expression_builder.register(OneOrMoreExpressionBuilder)
-@_walk_expression_builder.register(OptionalExpressionBuilder)
-@_walk_expression_builder.register(PositiveLookaheadExpressionBuilder)
-@_walk_expression_builder.register(PositiveOrMoreExpressionBuilder)
-@_walk_expression_builder.register(PositiveRepetitionRangeExpressionBuilder)
-@_walk_expression_builder.register(ZeroOrMoreExpressionBuilder)
-@_walk_expression_builder.register(ZeroRepetitionRangeExpressionBuilder)
-def _(
+) -> Sequence[int]:
+    return ()
+
+
+def _to_prioritized_choice_child_expression_builder_indices(
+    expression_builder: PrioritizedChoiceExpressionBuilder, /
+) -> Sequence[int]:
+    return expression_builder.variant_builder_indices
+
+
+def _to_sequence_child_expression_builder_indices(
+    expression_builder: SequenceExpressionBuilder, /
+) -> Sequence[int]:
+    return expression_builder.element_builder_indices
+
+
+def _to_unary_child_expression_builder_indices(
     expression_builder: (
         ExactRepetitionExpressionBuilder
         | NegativeLookaheadExpressionBuilder
@@ -427,52 +678,68 @@ def _(
         | ZeroRepetitionRangeExpressionBuilder
     ),
     /,
-    *,
-    expression_builders: Sequence[ExpressionBuilder[AnyMatch, AnyMismatch]],
-    used_expression_builder_indices: list[bool],
-) -> None:
-    expression_builder_index = expression_builder.expression_builder_index
-    used_expression_builder_indices[expression_builder_index] = True
-    _walk_expression_builder(
-        expression_builders[expression_builder_index],
-        expression_builders=expression_builders,
-        used_expression_builder_indices=used_expression_builder_indices,
+) -> Sequence[int]:
+    return (expression_builder.expression_builder_index,)
+
+
+_CHILD_EXPRESSION_BUILDER_INDICES_GETTERS: Final[
+    Mapping[type[ExpressionBuilder[Any, Any]], Callable[[Any], Sequence[int]]]
+] = MappingProxyType(
+    {
+        AnyCharacterExpressionBuilder: (
+            _to_leaf_child_expression_builder_indices
+        ),
+        CharacterClassExpressionBuilder: (
+            _to_leaf_child_expression_builder_indices
+        ),
+        ComplementedCharacterClassExpressionBuilder: (
+            _to_leaf_child_expression_builder_indices
+        ),
+        DoubleQuotedLiteralExpressionBuilder: (
+            _to_leaf_child_expression_builder_indices
+        ),
+        ExactRepetitionExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        NegativeLookaheadExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        OneOrMoreExpressionBuilder: _to_unary_child_expression_builder_indices,
+        OptionalExpressionBuilder: _to_unary_child_expression_builder_indices,
+        PositiveLookaheadExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        PositiveOrMoreExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        PositiveRepetitionRangeExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        PrioritizedChoiceExpressionBuilder: (
+            _to_prioritized_choice_child_expression_builder_indices
+        ),
+        RuleReferenceBuilder: _to_leaf_child_expression_builder_indices,
+        SequenceExpressionBuilder: (
+            _to_sequence_child_expression_builder_indices
+        ),
+        SingleQuotedLiteralExpressionBuilder: (
+            _to_leaf_child_expression_builder_indices
+        ),
+        ZeroOrMoreExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+        ZeroRepetitionRangeExpressionBuilder: (
+            _to_unary_child_expression_builder_indices
+        ),
+    }
+)
+assert (
+    len(
+        unsupported_classes := [
+            cls
+            for cls in to_package_non_abstract_subclasses(ExpressionBuilder)  # type: ignore[type-abstract]
+            if cls not in _CHILD_EXPRESSION_BUILDER_INDICES_GETTERS
+        ]
     )
-
-
-@_walk_expression_builder.register(PrioritizedChoiceExpressionBuilder)
-def _(
-    expression_builder: PrioritizedChoiceExpressionBuilder,
-    /,
-    *,
-    expression_builders: Sequence[ExpressionBuilder[AnyMatch, AnyMismatch]],
-    used_expression_builder_indices: list[bool],
-) -> None:
-    variant_builder_indices = expression_builder.variant_builder_indices
-    for variant_builder_index in variant_builder_indices:
-        used_expression_builder_indices[variant_builder_index] = True
-    for variant_builder_index in variant_builder_indices:
-        _walk_expression_builder(
-            expression_builders[variant_builder_index],
-            expression_builders=expression_builders,
-            used_expression_builder_indices=used_expression_builder_indices,
-        )
-
-
-@_walk_expression_builder.register(SequenceExpressionBuilder)
-def _(
-    expression_builder: SequenceExpressionBuilder,
-    /,
-    *,
-    expression_builders: Sequence[ExpressionBuilder[AnyMatch, AnyMismatch]],
-    used_expression_builder_indices: list[bool],
-) -> None:
-    element_builder_indices = expression_builder.element_builder_indices
-    for element_builder_index in element_builder_indices:
-        used_expression_builder_indices[element_builder_index] = True
-    for element_builder_index in element_builder_indices:
-        _walk_expression_builder(
-            expression_builders[element_builder_index],
-            expression_builders=expression_builders,
-            used_expression_builder_indices=used_expression_builder_indices,
-        )
+    == 0
+), unsupported_classes
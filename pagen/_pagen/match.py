@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Sequence
 from typing import (
     Any,
     ClassVar,
+    Final,
     TypeAlias,
     TypeGuard,
     TypeVar,
@@ -19,12 +21,21 @@ class LookaheadMatch:
     characters: ClassVar[str] = ''
     characters_count: ClassVar[int] = 0
 
+    _instance: ClassVar[LookaheadMatch | None] = None
+
+    __slots__ = ()
+
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
             f'type {LookaheadMatch.__qualname__!r} '
             'is not an acceptable base type'
         )
 
+    def __new__(cls, /) -> Self:
+        if (self := cls._instance) is None:
+            self = cls._instance = super().__new__(cls)
+        return self
+
     @overload
     def __eq__(self, other: Self, /) -> bool:
         pass
@@ -34,7 +45,10 @@ class LookaheadMatch:
         pass
 
     def __eq__(self, other: Any, /) -> Any:
-        return isinstance(other, LookaheadMatch) or NotImplemented
+        return other.__class__ is LookaheadMatch or NotImplemented
+
+    def __hash__(self, /) -> int:
+        return 0
 
     def __repr__(self, /) -> str:
         return f'{type(self).__qualname__}()'
@@ -50,7 +64,12 @@ class MatchLeaf:
     def characters_count(self, /) -> int:
         return len(self._characters)
 
-    __slots__ = ('_characters',)
+    MAX_SHARED_CHARACTER: ClassVar[str] = '\xff'
+    MAX_SHARED_CHARACTERS_COUNT: ClassVar[int] = 1
+
+    _shared_instances: ClassVar[dict[str, MatchLeaf]] = {}
+
+    __slots__ = '_characters', '_hash'
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -60,11 +79,23 @@ class MatchLeaf:
     def __new__(cls, /, *, characters: str) -> Self:
         if not isinstance(characters, str):
             raise TypeError(type(characters))
+        if (
+            len(characters) > cls.MAX_SHARED_CHARACTERS_COUNT
+            or characters > cls.MAX_SHARED_CHARACTER
+        ):
+            return cls._create(characters)
+        if (self := cls._shared_instances.get(characters)) is None:
+            self = cls._shared_instances[characters] = cls._create(characters)
+        return self
+
+    @classmethod
+    def _create(cls, characters: str, /) -> Self:
         self = super().__new__(cls)
-        self._characters = characters
+        self._characters, self._hash = characters, hash(characters)
         return self
 
     _characters: str
+    _hash: int
 
     @overload
     def __eq__(self, other: Self, /) -> bool:
@@ -75,12 +106,17 @@ class MatchLeaf:
         pass
 
     def __eq__(self, other: Any, /) -> Any:
+        if self is other:
+            return True
+        if other.__class__ is not MatchLeaf:
+            return NotImplemented
         return (
-            self._characters == other._characters
-            if isinstance(other, MatchLeaf)
-            else NotImplemented
+            self._hash == other._hash and self._characters == other._characters
         )
 
+    def __hash__(self, /) -> int:
+        return self._hash
+
     def __repr__(self, /) -> str:
         return f'{type(self).__qualname__}(characters={self._characters!r})'
 
@@ -91,17 +127,19 @@ class MatchTree:
 
     @property
     def characters(self, /) -> str:
-        return ''.join(child.characters for child in self._children)
+        if (result := self._characters) is None:
+            result = self._characters = _to_characters(self)
+        return result
 
     @property
     def characters_count(self, /) -> int:
-        return sum(child.characters_count for child in self._children)
+        return self._characters_count
 
     @property
     def children(self, /) -> Sequence[MatchTreeChild]:
         return self._children
 
-    __slots__ = ('_children',)
+    __slots__ = '_characters', '_characters_count', '_children', '_hash'
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -114,25 +152,28 @@ class MatchTree:
                 f'Expected at least {cls.MIN_CHILDREN_COUNT!r} children, '
                 f'but got {children!r}.'
             )
-        if (
-            len(
-                invalid_children := [
-                    child
-                    for child in children
-                    if not is_match_tree_child(child)
-                ]
-            )
-            > 0
-        ):
-            raise TypeError(
-                f'All children must have type {MatchTreeChild}, '
-                f'but got {invalid_children!r}.'
-            )
+        characters_count = 0
+        for child in children:
+            if not is_match_tree_child(child):
+                raise TypeError(
+                    f'All children must have type {MatchTreeChild}, '
+                    f'but got {child!r}.'
+                )
+            characters_count += child.characters_count
         self = super().__new__(cls)
-        self._children = children
+        children = tuple(children)
+        (
+            self._characters,
+            self._characters_count,
+            self._children,
+            self._hash,
+        ) = (None, characters_count, children, hash(children))
         return self
 
-    _children: Sequence[MatchTreeChild]
+    _characters: str | None
+    _characters_count: int
+    _children: tuple[MatchTreeChild, ...]
+    _hash: int
 
     @overload
     def __eq__(self, other: Self, /) -> bool:
@@ -143,25 +184,30 @@ class MatchTree:
         pass
 
     def __eq__(self, other: Any, /) -> Any:
-        return (
-            self._children == other._children
-            if isinstance(other, MatchTree)
-            else NotImplemented
-        )
+        if self is other:
+            return True
+        if other.__class__ is not MatchTree:
+            return NotImplemented
+        return self._hash == other._hash and self._children == other._children
+
+    def __hash__(self, /) -> int:
+        return self._hash
 
     def __repr__(self, /) -> str:
-        return f'{type(self).__qualname__}(children={self.children!r})'
+        return _to_repr(self)
 
 
 @final
 class RuleMatch:
     @property
     def characters(self, /) -> str:
-        return self._match.characters
+        if (result := self._characters) is None:
+            result = self._characters = self._match.characters
+        return result
 
     @property
     def characters_count(self, /) -> int:
-        return self._match.characters_count
+        return self._characters_count
 
     @property
     def match(self, /) -> AnyMatch:
@@ -171,7 +217,14 @@ class RuleMatch:
     def rule_name(self, /) -> str:
         return self._rule_name
 
-    __slots__ = '_match', '_rule_name'
+    __slots__ = (
+        '_characters',
+        '_characters_count',
+        '_hash',
+        '_is_match_tree_child',
+        '_match',
+        '_rule_name',
+    )
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -179,15 +232,31 @@ class RuleMatch:
         )
 
     def __new__(cls, rule_name: str, /, *, match: AnyMatch) -> Self:
-        _validate_rule_name(rule_name)
-        if not isinstance(
-            match, LookaheadMatch | MatchLeaf | MatchTree | RuleMatch
-        ):
+        rule_name = _to_validated_rule_name(rule_name)
+        if not isinstance(match, _MATCH_CLASSES):
             raise TypeError(type(match))
         self = super().__new__(cls)
-        self._match, self._rule_name = match, rule_name
+        (
+            self._characters,
+            self._characters_count,
+            self._hash,
+            self._is_match_tree_child,
+            self._match,
+            self._rule_name,
+        ) = (
+            None,
+            match.characters_count,
+            hash((rule_name, match)),
+            is_match_tree_child(match),
+            match,
+            rule_name,
+        )
         return self
 
+    _characters: str | None
+    _characters_count: int
+    _hash: int
+    _is_match_tree_child: bool
     _match: AnyMatch
     _rule_name: str
 
@@ -200,22 +269,21 @@ class RuleMatch:
         pass
 
     def __eq__(self, other: Any, /) -> Any:
+        if self is other:
+            return True
+        if other.__class__ is not RuleMatch:
+            return NotImplemented
         return (
-            (
-                self._rule_name == other._rule_name
-                and self._match == other._match
-            )
-            if isinstance(other, RuleMatch)
-            else NotImplemented
+            self._hash == other._hash
+            and self._rule_name == other._rule_name
+            and self._match == other._match
         )
 
+    def __hash__(self, /) -> int:
+        return self._hash
+
     def __repr__(self, /) -> str:
-        return (
-            f'{type(self).__qualname__}'
-            '('
-            f'rule_name={self._rule_name!r}, match={self._match!r}'
-            ')'
-        )
+        return _to_repr(self)
 
 
 AnyMatch: TypeAlias = LookaheadMatch | MatchLeaf | MatchTree | RuleMatch
@@ -232,13 +300,77 @@ MatchT_co = TypeVar(
     covariant=True,
 )
 
+_MATCH_CLASSES: Final[tuple[type[AnyMatch], ...]] = (
+    LookaheadMatch,
+    MatchLeaf,
+    MatchTree,
+    RuleMatch,
+)
+
 
 def is_match_tree_child(value: AnyMatch, /) -> TypeGuard[MatchTreeChild]:
-    return isinstance(value, MatchLeaf | MatchTree) or (
-        isinstance(value, RuleMatch) and is_match_tree_child(value.match)
+    value_cls = type(value)
+    return (
+        value_cls is MatchLeaf
+        or value_cls is MatchTree
+        or (isinstance(value, RuleMatch) and value._is_match_tree_child)
     )
 
 
-def _validate_rule_name(rule_name: str | None, /) -> None:
-    if not isinstance(rule_name, str | None):
+def _to_validated_rule_name(rule_name: str, /) -> str:
+    if type(rule_name) is str:
+        return sys.intern(rule_name)
+    if rule_name is not None and not isinstance(rule_name, str):
         raise TypeError(type(rule_name))
+    return rule_name
+
+
+def _to_characters(tree: MatchTree, /) -> str:
+    parts: list[str] = []
+    stack: list[AnyMatch] = [tree]
+    while stack:
+        item = stack.pop()
+        if item.__class__ is MatchTree:
+            assert isinstance(item, MatchTree), item
+            if (characters := item._characters) is None:
+                stack.extend(reversed(item._children))
+            else:
+                parts.append(characters)
+        elif item.__class__ is RuleMatch:
+            assert isinstance(item, RuleMatch), item
+            if (characters := item._characters) is None:
+                stack.append(item._match)
+            else:
+                parts.append(characters)
+        else:
+            parts.append(item.characters)
+    return ''.join(parts)
+
+
+def _to_repr(match: MatchTree | RuleMatch, /) -> str:
+    parts: list[str] = []
+    stack: list[AnyMatch | str] = [match]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        elif item.__class__ is MatchTree:
+            assert isinstance(item, MatchTree), item
+            children = item._children
+            stack.append(',))' if len(children) == 1 else '))')
+            for child_index in range(len(children) - 1, 0, -1):
+                stack.append(children[child_index])
+                stack.append(', ')
+            stack.append(children[0])
+            parts.append(f'{MatchTree.__qualname__}(children=(')
+        elif item.__class__ is RuleMatch:
+            assert isinstance(item, RuleMatch), item
+            stack.append(')')
+            stack.append(item._match)
+            parts.append(
+                f'{RuleMatch.__qualname__}'
+                f'(rule_name={item._rule_name!r}, match='
+            )
+        else:
+            parts.append(repr(item))
+    return ''.join(parts)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Sequence
-from typing import ClassVar, TypeAlias, TypeVar, final
+from typing import Any, ClassVar, Final, TypeAlias, TypeVar, final, overload
 
 from typing_extensions import Self, override
 
@@ -27,6 +27,7 @@ class MismatchLeaf:
 
     __slots__ = (
         '_expected_message',
+        '_hash',
         '_origin_name',
         '_start_index',
         '_stop_index',
@@ -56,17 +57,53 @@ class MismatchLeaf:
         self = super().__new__(cls)
         (
             self._expected_message,
+            self._hash,
             self._origin_name,
             self._start_index,
             self._stop_index,
-        ) = (expected_message, origin_name, start_index, stop_index)
+        ) = (expected_message, None, origin_name, start_index, stop_index)
         return self
 
     _expected_message: str
+    _hash: int | None
     _origin_name: str
     _start_index: int
     _stop_index: int
 
+    @overload
+    def __eq__(self, other: Self, /) -> bool:
+        pass
+
+    @overload
+    def __eq__(self, other: Any, /) -> Any:
+        pass
+
+    @override
+    def __eq__(self, other: Any, /) -> Any:
+        if self is other:
+            return True
+        if other.__class__ is not MismatchLeaf:
+            return NotImplemented
+        return (
+            self._origin_name == other._origin_name
+            and self._expected_message == other._expected_message
+            and self._start_index == other._start_index
+            and self._stop_index == other._stop_index
+        )
+
+    @override
+    def __hash__(self, /) -> int:
+        if (result := self._hash) is None:
+            result = self._hash = hash(
+                (
+                    self._origin_name,
+                    self._expected_message,
+                    self._start_index,
+                    self._stop_index,
+                )
+            )
+        return result
+
     @override
     def __repr__(self, /) -> str:
         return (
@@ -94,11 +131,19 @@ class MismatchTree:
 
     @property
     def start_index(self, /) -> int:
-        return self._children[-1].start_index
+        return self._start_index
 
     @property
     def stop_index(self, /) -> int:
-        return self._children[-1].stop_index
+        return self._stop_index
+
+    __slots__ = (
+        '_children',
+        '_hash',
+        '_origin_name',
+        '_start_index',
+        '_stop_index',
+    )
 
     def __init_subclass__(cls, /) -> None:
         raise TypeError(
@@ -116,42 +161,100 @@ class MismatchTree:
                 f'Expected at least {cls.MIN_CHILDREN_COUNT!r} children, '
                 f'but got {children!r}.'
             )
-        if (
-            len(
-                invalid_children := [
-                    child
-                    for child in children
-                    if not isinstance(child, AnyMismatch)
-                ]
-            )
-            > 0
-        ):
-            raise TypeError(
-                f'All children must have type {AnyMismatch}, '
-                f'but got {invalid_children!r}.'
-            )
+        for child in children:
+            if not isinstance(child, _MISMATCH_CLASSES):
+                raise TypeError(
+                    f'All children must have type {AnyMismatch}, '
+                    f'but got {child!r}.'
+                )
         self = super().__new__(cls)
-        self._children, self._origin_name = children, origin_name
+        children = tuple(children)
+        last_child = children[-1]
+        (
+            self._children,
+            self._hash,
+            self._origin_name,
+            self._start_index,
+            self._stop_index,
+        ) = (
+            children,
+            None,
+            origin_name,
+            last_child.start_index,
+            last_child.stop_index,
+        )
         return self
 
-    _children: Sequence[AnyMismatch]
+    _children: tuple[AnyMismatch, ...]
+    _hash: int | None
     _origin_name: str
+    _start_index: int
+    _stop_index: int
+
+    @overload
+    def __eq__(self, other: Self, /) -> bool:
+        pass
+
+    @overload
+    def __eq__(self, other: Any, /) -> Any:
+        pass
 
     @override
-    def __repr__(self, /) -> str:
+    def __eq__(self, other: Any, /) -> Any:
+        if self is other:
+            return True
+        if other.__class__ is not MismatchTree:
+            return NotImplemented
         return (
-            f'{type(self).__qualname__}'
-            '('
-            f'{self._origin_name!r}, children={self._children!r}'
-            ')'
+            self._origin_name == other._origin_name
+            and self._children == other._children
         )
 
+    @override
+    def __hash__(self, /) -> int:
+        if (result := self._hash) is None:
+            result = self._hash = hash((self._origin_name, self._children))
+        return result
+
+    @override
+    def __repr__(self, /) -> str:
+        return _to_repr(self)
+
 
 AnyMismatch: TypeAlias = MismatchLeaf | MismatchTree
 MismatchT_co = TypeVar(
     'MismatchT_co', MismatchLeaf, MismatchTree, AnyMismatch, covariant=True
 )
 
+_MISMATCH_CLASSES: Final[tuple[type[AnyMismatch], ...]] = (
+    MismatchLeaf,
+    MismatchTree,
+)
+
+
+def _to_repr(mismatch: MismatchTree, /) -> str:
+    parts: list[str] = []
+    stack: list[AnyMismatch | str] = [mismatch]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        elif item.__class__ is MismatchTree:
+            assert isinstance(item, MismatchTree), item
+            children = item._children
+            stack.append(',))' if len(children) == 1 else '))')
+            for child_index in range(len(children) - 1, 0, -1):
+                stack.append(children[child_index])
+                stack.append(', ')
+            stack.append(children[0])
+            parts.append(
+                f'{MismatchTree.__qualname__}'
+                f'({item._origin_name!r}, children=('
+            )
+        else:
+            parts.append(repr(item))
+    return ''.join(parts)
+
 
 def _validate_index(index: int) -> None:
     if not isinstance(index, int):
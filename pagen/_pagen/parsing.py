@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import contextlib
+import functools
 import inspect
-from collections.abc import Iterator, Mapping
-from enum import Enum, unique
-from typing import ClassVar, Final, TypeVar
+import re
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType, TracebackType
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, TypeVar, final
 
-from typing_extensions import override
+from typing_extensions import Self
 
 from . import CharacterRange, CharacterSet
 from .constants import (
@@ -42,78 +44,119 @@ from .rule import Rule
 from .utils import to_package_non_abstract_subclasses
 
 
-@unique
-class RuleName(str, Enum):
-    ANY_CHARACTER = AnyCharacterExpression.__name__
-    CHARACTER_CLASS = CharacterClassExpression.__name__
-    CHARACTER_CONTAINER = 'CharacterContainer'
-    CHARACTER_CONTAINER_ELEMENT = 'CharacterContainerElement'
-    CHARACTER_RANGE = CharacterRange.__name__
-    CHARACTER_SET = CharacterSet.__name__
-    COMPLEMENTED_CHARACTER_CLASS = (
+@final
+class RuleName:
+    ANY_CHARACTER: Final[str] = AnyCharacterExpression.__name__
+    CHARACTER_CLASS: Final[str] = CharacterClassExpression.__name__
+    CHARACTER_CONTAINER: Final[str] = 'CharacterContainer'
+    CHARACTER_CONTAINER_ELEMENT: Final[str] = 'CharacterContainerElement'
+    CHARACTER_RANGE: Final[str] = CharacterRange.__name__
+    CHARACTER_SET: Final[str] = CharacterSet.__name__
+    COMPLEMENTED_CHARACTER_CLASS: Final[str] = (
         ComplementedCharacterClassExpression.__name__
     )
-    DOUBLE_QUOTED_LITERAL = DoubleQuotedLiteralExpression.__name__
-    DOUBLE_QUOTED_LITERAL_CHARACTER = (
+    DOUBLE_QUOTED_LITERAL: Final[str] = DoubleQuotedLiteralExpression.__name__
+    DOUBLE_QUOTED_LITERAL_CHARACTER: Final[str] = (
         f'{DoubleQuotedLiteralExpression.__name__}Character'
     )
-    END_OF_FILE = 'EndOfFile'
-    END_OF_LINE = 'EndOfLine'
-    EXACT_REPETITION = ExactRepetitionExpression.__name__
-    EXPRESSION = Expression.__name__
-    FILLER = 'Filler'
-    GRAMMAR = Grammar.__name__
-    IDENTIFIER = 'Identifier'
-    LEFT_ARROW = 'LEFT_ARROW'
-    NEGATIVE_LOOKAHEAD = NegativeLookaheadExpression.__name__
-    NON_NULLABLE_SEQUENCE_ELEMENT = (
+    END_OF_FILE: Final[str] = 'EndOfFile'
+    END_OF_LINE: Final[str] = 'EndOfLine'
+    EXACT_REPETITION: Final[str] = ExactRepetitionExpression.__name__
+    EXPRESSION: Final[str] = Expression.__name__
+    FILLER: Final[str] = 'Filler'
+    GRAMMAR: Final[str] = Grammar.__name__
+    IDENTIFIER: Final[str] = 'Identifier'
+    LEFT_ARROW: Final[str] = 'LEFT_ARROW'
+    NEGATIVE_LOOKAHEAD: Final[str] = NegativeLookaheadExpression.__name__
+    NON_NULLABLE_SEQUENCE_ELEMENT: Final[str] = (
         f'NonNullable{SequenceExpression.__name__}Element'
     )
-    NON_NULLABLE_TERM = 'NonNullableTerm'
-    NULLABLE_SEQUENCE_ELEMENT = f'Nullable{SequenceExpression.__name__}Element'
-    ONE_OR_MORE = OneOrMoreExpression.__name__
-    OPTIONAL = OptionalExpression.__name__
-    POSITIVE_LOOKAHEAD = PositiveLookaheadExpression.__name__
-    POSITIVE_OR_MORE_EXPRESSION = PositiveOrMoreExpression.__name__
-    POSITIVE_REPETITION_RANGE = PositiveRepetitionRangeExpression.__name__
-    PRIORITIZED_CHOICE = PrioritizedChoiceExpression.__name__
-    PRIORITIZED_CHOICE_VARIANT = (
+    NON_NULLABLE_TERM: Final[str] = 'NonNullableTerm'
+    NULLABLE_SEQUENCE_ELEMENT: Final[str] = (
+        f'Nullable{SequenceExpression.__name__}Element'
+    )
+    ONE_OR_MORE: Final[str] = OneOrMoreExpression.__name__
+    OPTIONAL: Final[str] = OptionalExpression.__name__
+    POSITIVE_LOOKAHEAD: Final[str] = PositiveLookaheadExpression.__name__
+    POSITIVE_OR_MORE_EXPRESSION: Final[str] = PositiveOrMoreExpression.__name__
+    POSITIVE_REPETITION_RANGE: Final[str] = (
+        PositiveRepetitionRangeExpression.__name__
+    )
+    PRIORITIZED_CHOICE: Final[str] = PrioritizedChoiceExpression.__name__
+    PRIORITIZED_CHOICE_VARIANT: Final[str] = (
         f'{PrioritizedChoiceExpression.__name__}Variant'
     )
-    RULE = Rule.__name__
-    RULE_REFERENCE = RuleReference.__name__
-    SEQUENCE = SequenceExpression.__name__
-    SEQUENCE_ELEMENT = f'{SequenceExpression.__name__}Element'
-    SINGLE_LINE_COMMENT = 'SingleLineComment'
-    SINGLE_QUOTED_LITERAL = SingleQuotedLiteralExpression.__name__
-    SINGLE_QUOTED_LITERAL_CHARACTER = (
+    RULE: Final[str] = Rule.__name__
+    RULE_REFERENCE: Final[str] = RuleReference.__name__
+    SEQUENCE: Final[str] = SequenceExpression.__name__
+    SEQUENCE_ELEMENT: Final[str] = f'{SequenceExpression.__name__}Element'
+    SINGLE_LINE_COMMENT: Final[str] = 'SingleLineComment'
+    SINGLE_QUOTED_LITERAL: Final[str] = SingleQuotedLiteralExpression.__name__
+    SINGLE_QUOTED_LITERAL_CHARACTER: Final[str] = (
         f'{SingleQuotedLiteralExpression.__name__}Character'
     )
-    SPACE = 'Space'
-    UNSIGNED_INTEGER = 'UnsignedInteger'
-    ZERO_OR_MORE = ZeroOrMoreExpression.__name__
-    ZERO_REPETITION_RANGE = ZeroRepetitionRangeExpression.__name__
+    SPACE: Final[str] = 'Space'
+    UNSIGNED_INTEGER: Final[str] = 'UnsignedInteger'
+    ZERO_OR_MORE: Final[str] = ZeroOrMoreExpression.__name__
+    ZERO_REPETITION_RANGE: Final[str] = ZeroRepetitionRangeExpression.__name__
 
-    @override
-    def __repr__(self, /) -> str:
-        return f'{type(self).__qualname__}.{self._name_}'
 
-    @override
-    def __str__(self, /) -> str:
-        return self._value_
+_RULE_NAMES: Final[tuple[str, ...]] = tuple(
+    value for name, value in vars(RuleName).items() if not name.startswith('_')
+)
+assert len(set(_RULE_NAMES)) == len(_RULE_NAMES), _RULE_NAMES
 
 
+@functools.cache
 def _build_parser_grammar() -> Grammar:
     grammar_builder = GrammarBuilder()
+    rule_reference = grammar_builder.rule_reference
+    escape_character_index = grammar_builder.single_quoted_literal_expression(
+        '\\'
+    )
+    non_escaped_character_index = grammar_builder.sequence_expression(
+        [
+            grammar_builder.negative_lookahead_expression(
+                escape_character_index
+            ),
+            grammar_builder.any_character_expression(),
+        ]
+    )
+
+    def add_escaped_character_rule(
+        rule_name: str, special_characters: str, /
+    ) -> None:
+        grammar_builder.add_rule(
+            rule_name,
+            grammar_builder.prioritized_choice_expression(
+                [
+                    grammar_builder.sequence_expression(
+                        [
+                            escape_character_index,
+                            grammar_builder.character_class_expression(
+                                [
+                                    CharacterSet(
+                                        special_characters
+                                        + COMMON_SPECIAL_CHARACTERS
+                                    )
+                                ]
+                            ),
+                        ]
+                    ),
+                    non_escaped_character_index,
+                ]
+            ),
+        )
+
     grammar_builder.add_rule(
         RuleName.GRAMMAR,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.one_or_more_expression(
-                    grammar_builder.rule_reference(RuleName.RULE)
+                    rule_reference(RuleName.RULE)
                 ),
-                grammar_builder.rule_reference(RuleName.END_OF_FILE),
+                rule_reference(RuleName.END_OF_FILE),
             ]
         ),
     )
@@ -121,11 +164,11 @@ def _build_parser_grammar() -> Grammar:
         RuleName.RULE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.IDENTIFIER),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.LEFT_ARROW),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.EXPRESSION),
+                rule_reference(RuleName.IDENTIFIER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.LEFT_ARROW),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.EXPRESSION),
             ]
         ),
     )
@@ -133,10 +176,8 @@ def _build_parser_grammar() -> Grammar:
         RuleName.EXPRESSION,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(RuleName.PRIORITIZED_CHOICE),
-                grammar_builder.rule_reference(
-                    RuleName.PRIORITIZED_CHOICE_VARIANT
-                ),
+                rule_reference(RuleName.PRIORITIZED_CHOICE),
+                rule_reference(RuleName.PRIORITIZED_CHOICE_VARIANT),
             ]
         ),
     )
@@ -144,17 +185,15 @@ def _build_parser_grammar() -> Grammar:
         RuleName.PRIORITIZED_CHOICE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(
-                    RuleName.PRIORITIZED_CHOICE_VARIANT
-                ),
+                rule_reference(RuleName.PRIORITIZED_CHOICE_VARIANT),
                 grammar_builder.one_or_more_expression(
                     grammar_builder.sequence_expression(
                         [
                             grammar_builder.single_quoted_literal_expression(
                                 '/'
                             ),
-                            grammar_builder.rule_reference(RuleName.FILLER),
-                            grammar_builder.rule_reference(
+                            rule_reference(RuleName.FILLER),
+                            rule_reference(
                                 RuleName.PRIORITIZED_CHOICE_VARIANT
                             ),
                         ]
@@ -167,8 +206,8 @@ def _build_parser_grammar() -> Grammar:
         RuleName.PRIORITIZED_CHOICE_VARIANT,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(RuleName.SEQUENCE),
-                grammar_builder.rule_reference(RuleName.SEQUENCE_ELEMENT),
+                rule_reference(RuleName.SEQUENCE),
+                rule_reference(RuleName.SEQUENCE_ELEMENT),
             ]
         ),
     )
@@ -176,9 +215,9 @@ def _build_parser_grammar() -> Grammar:
         RuleName.SEQUENCE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.SEQUENCE_ELEMENT),
+                rule_reference(RuleName.SEQUENCE_ELEMENT),
                 grammar_builder.one_or_more_expression(
-                    grammar_builder.rule_reference(RuleName.SEQUENCE_ELEMENT)
+                    rule_reference(RuleName.SEQUENCE_ELEMENT)
                 ),
             ]
         ),
@@ -187,12 +226,8 @@ def _build_parser_grammar() -> Grammar:
         RuleName.SEQUENCE_ELEMENT,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(
-                    RuleName.NULLABLE_SEQUENCE_ELEMENT
-                ),
-                grammar_builder.rule_reference(
-                    RuleName.NON_NULLABLE_SEQUENCE_ELEMENT
-                ),
+                rule_reference(RuleName.NULLABLE_SEQUENCE_ELEMENT),
+                rule_reference(RuleName.NON_NULLABLE_SEQUENCE_ELEMENT),
             ]
         ),
     )
@@ -200,15 +235,11 @@ def _build_parser_grammar() -> Grammar:
         RuleName.NON_NULLABLE_SEQUENCE_ELEMENT,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(RuleName.EXACT_REPETITION),
-                grammar_builder.rule_reference(RuleName.ONE_OR_MORE),
-                grammar_builder.rule_reference(
-                    RuleName.POSITIVE_OR_MORE_EXPRESSION
-                ),
-                grammar_builder.rule_reference(
-                    RuleName.POSITIVE_REPETITION_RANGE
-                ),
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.EXACT_REPETITION),
+                rule_reference(RuleName.ONE_OR_MORE),
+                rule_reference(RuleName.POSITIVE_OR_MORE_EXPRESSION),
+                rule_reference(RuleName.POSITIVE_REPETITION_RANGE),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
             ]
         ),
     )
@@ -219,19 +250,17 @@ def _build_parser_grammar() -> Grammar:
                 grammar_builder.sequence_expression(
                     [
                         grammar_builder.single_quoted_literal_expression('('),
-                        grammar_builder.rule_reference(RuleName.FILLER),
-                        grammar_builder.rule_reference(
-                            RuleName.NULLABLE_SEQUENCE_ELEMENT
-                        ),
+                        rule_reference(RuleName.FILLER),
+                        rule_reference(RuleName.NULLABLE_SEQUENCE_ELEMENT),
                         grammar_builder.single_quoted_literal_expression(')'),
-                        grammar_builder.rule_reference(RuleName.FILLER),
+                        rule_reference(RuleName.FILLER),
                     ]
                 ),
-                grammar_builder.rule_reference(RuleName.NEGATIVE_LOOKAHEAD),
-                grammar_builder.rule_reference(RuleName.POSITIVE_LOOKAHEAD),
-                grammar_builder.rule_reference(RuleName.OPTIONAL),
-                grammar_builder.rule_reference(RuleName.ZERO_OR_MORE),
-                grammar_builder.rule_reference(RuleName.ZERO_REPETITION_RANGE),
+                rule_reference(RuleName.NEGATIVE_LOOKAHEAD),
+                rule_reference(RuleName.POSITIVE_LOOKAHEAD),
+                rule_reference(RuleName.OPTIONAL),
+                rule_reference(RuleName.ZERO_OR_MORE),
+                rule_reference(RuleName.ZERO_REPETITION_RANGE),
             ]
         ),
     )
@@ -240,10 +269,8 @@ def _build_parser_grammar() -> Grammar:
         grammar_builder.sequence_expression(
             [
                 grammar_builder.single_quoted_literal_expression('!'),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(
-                    RuleName.NON_NULLABLE_SEQUENCE_ELEMENT
-                ),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.NON_NULLABLE_SEQUENCE_ELEMENT),
             ]
         ),
     )
@@ -252,10 +279,8 @@ def _build_parser_grammar() -> Grammar:
         grammar_builder.sequence_expression(
             [
                 grammar_builder.single_quoted_literal_expression('&'),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(
-                    RuleName.NON_NULLABLE_SEQUENCE_ELEMENT
-                ),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.NON_NULLABLE_SEQUENCE_ELEMENT),
             ]
         ),
     )
@@ -263,13 +288,13 @@ def _build_parser_grammar() -> Grammar:
         RuleName.EXACT_REPETITION,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('{'),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.UNSIGNED_INTEGER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.UNSIGNED_INTEGER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression('}'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -277,9 +302,9 @@ def _build_parser_grammar() -> Grammar:
         RuleName.OPTIONAL,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('?'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -287,9 +312,9 @@ def _build_parser_grammar() -> Grammar:
         RuleName.ONE_OR_MORE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('+'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -297,15 +322,15 @@ def _build_parser_grammar() -> Grammar:
         RuleName.POSITIVE_OR_MORE_EXPRESSION,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('{'),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.UNSIGNED_INTEGER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.UNSIGNED_INTEGER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression(','),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression('}'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -313,17 +338,17 @@ def _build_parser_grammar() -> Grammar:
         RuleName.POSITIVE_REPETITION_RANGE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('{'),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.UNSIGNED_INTEGER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.UNSIGNED_INTEGER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression(','),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.UNSIGNED_INTEGER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.UNSIGNED_INTEGER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression('}'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -331,9 +356,9 @@ def _build_parser_grammar() -> Grammar:
         RuleName.ZERO_OR_MORE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('*'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -341,15 +366,15 @@ def _build_parser_grammar() -> Grammar:
         RuleName.ZERO_REPETITION_RANGE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.NON_NULLABLE_TERM),
+                rule_reference(RuleName.NON_NULLABLE_TERM),
                 grammar_builder.single_quoted_literal_expression('{'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression(','),
-                grammar_builder.rule_reference(RuleName.FILLER),
-                grammar_builder.rule_reference(RuleName.UNSIGNED_INTEGER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.UNSIGNED_INTEGER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.single_quoted_literal_expression('}'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -360,32 +385,26 @@ def _build_parser_grammar() -> Grammar:
                 grammar_builder.sequence_expression(
                     [
                         grammar_builder.single_quoted_literal_expression('('),
-                        grammar_builder.rule_reference(RuleName.FILLER),
+                        rule_reference(RuleName.FILLER),
                         grammar_builder.prioritized_choice_expression(
                             [
-                                grammar_builder.rule_reference(
-                                    RuleName.PRIORITIZED_CHOICE
-                                ),
-                                grammar_builder.rule_reference(
-                                    RuleName.SEQUENCE
-                                ),
-                                grammar_builder.rule_reference(
+                                rule_reference(RuleName.PRIORITIZED_CHOICE),
+                                rule_reference(RuleName.SEQUENCE),
+                                rule_reference(
                                     RuleName.NON_NULLABLE_SEQUENCE_ELEMENT
                                 ),
                             ]
                         ),
                         grammar_builder.single_quoted_literal_expression(')'),
-                        grammar_builder.rule_reference(RuleName.FILLER),
+                        rule_reference(RuleName.FILLER),
                     ]
                 ),
-                grammar_builder.rule_reference(RuleName.ANY_CHARACTER),
-                grammar_builder.rule_reference(
-                    RuleName.COMPLEMENTED_CHARACTER_CLASS
-                ),
-                grammar_builder.rule_reference(RuleName.CHARACTER_CLASS),
-                grammar_builder.rule_reference(RuleName.DOUBLE_QUOTED_LITERAL),
-                grammar_builder.rule_reference(RuleName.SINGLE_QUOTED_LITERAL),
-                grammar_builder.rule_reference(RuleName.RULE_REFERENCE),
+                rule_reference(RuleName.ANY_CHARACTER),
+                rule_reference(RuleName.COMPLEMENTED_CHARACTER_CLASS),
+                rule_reference(RuleName.CHARACTER_CLASS),
+                rule_reference(RuleName.DOUBLE_QUOTED_LITERAL),
+                rule_reference(RuleName.SINGLE_QUOTED_LITERAL),
+                rule_reference(RuleName.RULE_REFERENCE),
             ]
         ),
     )
@@ -393,10 +412,10 @@ def _build_parser_grammar() -> Grammar:
         RuleName.RULE_REFERENCE,
         grammar_builder.sequence_expression(
             [
-                grammar_builder.rule_reference(RuleName.IDENTIFIER),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.IDENTIFIER),
+                rule_reference(RuleName.FILLER),
                 grammar_builder.negative_lookahead_expression(
-                    grammar_builder.rule_reference(RuleName.LEFT_ARROW)
+                    rule_reference(RuleName.LEFT_ARROW)
                 ),
             ]
         ),
@@ -406,69 +425,17 @@ def _build_parser_grammar() -> Grammar:
         grammar_builder.sequence_expression(
             [
                 grammar_builder.single_quoted_literal_expression('.'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
-    grammar_builder.add_rule(
+    add_escaped_character_rule(
         RuleName.DOUBLE_QUOTED_LITERAL_CHARACTER,
-        grammar_builder.prioritized_choice_expression(
-            [
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.single_quoted_literal_expression('\\'),
-                        grammar_builder.character_class_expression(
-                            [
-                                CharacterSet(
-                                    DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
-                                    + COMMON_SPECIAL_CHARACTERS
-                                )
-                            ]
-                        ),
-                    ]
-                ),
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.negative_lookahead_expression(
-                            grammar_builder.single_quoted_literal_expression(
-                                '\\'
-                            )
-                        ),
-                        grammar_builder.any_character_expression(),
-                    ]
-                ),
-            ]
-        ),
+        DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTERS,
     )
-    grammar_builder.add_rule(
+    add_escaped_character_rule(
         RuleName.SINGLE_QUOTED_LITERAL_CHARACTER,
-        grammar_builder.prioritized_choice_expression(
-            [
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.single_quoted_literal_expression('\\'),
-                        grammar_builder.character_class_expression(
-                            [
-                                CharacterSet(
-                                    SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
-                                    + COMMON_SPECIAL_CHARACTERS
-                                )
-                            ]
-                        ),
-                    ]
-                ),
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.negative_lookahead_expression(
-                            grammar_builder.single_quoted_literal_expression(
-                                '\\'
-                            )
-                        ),
-                        grammar_builder.any_character_expression(),
-                    ]
-                ),
-            ]
-        ),
+        SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTERS,
     )
     grammar_builder.add_rule(
         RuleName.CHARACTER_CLASS,
@@ -476,12 +443,10 @@ def _build_parser_grammar() -> Grammar:
             [
                 grammar_builder.single_quoted_literal_expression('['),
                 grammar_builder.one_or_more_expression(
-                    grammar_builder.rule_reference(
-                        RuleName.CHARACTER_CONTAINER
-                    )
+                    rule_reference(RuleName.CHARACTER_CONTAINER)
                 ),
                 grammar_builder.single_quoted_literal_expression(']'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -491,12 +456,10 @@ def _build_parser_grammar() -> Grammar:
             [
                 grammar_builder.single_quoted_literal_expression('[^'),
                 grammar_builder.one_or_more_expression(
-                    grammar_builder.rule_reference(
-                        RuleName.CHARACTER_CONTAINER
-                    )
+                    rule_reference(RuleName.CHARACTER_CONTAINER)
                 ),
                 grammar_builder.single_quoted_literal_expression(']'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -504,8 +467,8 @@ def _build_parser_grammar() -> Grammar:
         RuleName.CHARACTER_CONTAINER,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(RuleName.CHARACTER_RANGE),
-                grammar_builder.rule_reference(RuleName.CHARACTER_SET),
+                rule_reference(RuleName.CHARACTER_RANGE),
+                rule_reference(RuleName.CHARACTER_SET),
             ]
         ),
     )
@@ -516,13 +479,9 @@ def _build_parser_grammar() -> Grammar:
                 grammar_builder.negative_lookahead_expression(
                     grammar_builder.single_quoted_literal_expression(']')
                 ),
-                grammar_builder.rule_reference(
-                    RuleName.CHARACTER_CONTAINER_ELEMENT
-                ),
+                rule_reference(RuleName.CHARACTER_CONTAINER_ELEMENT),
                 grammar_builder.single_quoted_literal_expression('-'),
-                grammar_builder.rule_reference(
-                    RuleName.CHARACTER_CONTAINER_ELEMENT
-                ),
+                rule_reference(RuleName.CHARACTER_CONTAINER_ELEMENT),
             ]
         ),
     )
@@ -534,9 +493,7 @@ def _build_parser_grammar() -> Grammar:
                     grammar_builder.negative_lookahead_expression(
                         grammar_builder.single_quoted_literal_expression(']')
                     ),
-                    grammar_builder.rule_reference(
-                        RuleName.CHARACTER_CONTAINER_ELEMENT
-                    ),
+                    rule_reference(RuleName.CHARACTER_CONTAINER_ELEMENT),
                     grammar_builder.negative_lookahead_expression(
                         grammar_builder.single_quoted_literal_expression('-')
                     ),
@@ -544,35 +501,9 @@ def _build_parser_grammar() -> Grammar:
             )
         ),
     )
-    grammar_builder.add_rule(
+    add_escaped_character_rule(
         RuleName.CHARACTER_CONTAINER_ELEMENT,
-        grammar_builder.prioritized_choice_expression(
-            [
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.single_quoted_literal_expression('\\'),
-                        grammar_builder.character_class_expression(
-                            [
-                                CharacterSet(
-                                    CHARACTER_CLASS_SPECIAL_CHARACTERS
-                                    + COMMON_SPECIAL_CHARACTERS
-                                )
-                            ]
-                        ),
-                    ]
-                ),
-                grammar_builder.sequence_expression(
-                    [
-                        grammar_builder.negative_lookahead_expression(
-                            grammar_builder.single_quoted_literal_expression(
-                                '\\'
-                            )
-                        ),
-                        grammar_builder.any_character_expression(),
-                    ]
-                ),
-            ]
-        ),
+        CHARACTER_CLASS_SPECIAL_CHARACTERS,
     )
     grammar_builder.add_rule(
         RuleName.DOUBLE_QUOTED_LITERAL,
@@ -587,14 +518,14 @@ def _build_parser_grammar() -> Grammar:
                                     '"'
                                 )
                             ),
-                            grammar_builder.rule_reference(
+                            rule_reference(
                                 RuleName.DOUBLE_QUOTED_LITERAL_CHARACTER
                             ),
                         ]
                     )
                 ),
                 grammar_builder.single_quoted_literal_expression('"'),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -611,14 +542,14 @@ def _build_parser_grammar() -> Grammar:
                                     "'"
                                 )
                             ),
-                            grammar_builder.rule_reference(
+                            rule_reference(
                                 RuleName.SINGLE_QUOTED_LITERAL_CHARACTER
                             ),
                         ]
                     )
                 ),
                 grammar_builder.single_quoted_literal_expression("'"),
-                grammar_builder.rule_reference(RuleName.FILLER),
+                rule_reference(RuleName.FILLER),
             ]
         ),
     )
@@ -667,10 +598,8 @@ def _build_parser_grammar() -> Grammar:
         grammar_builder.zero_or_more_expression(
             grammar_builder.prioritized_choice_expression(
                 [
-                    grammar_builder.rule_reference(RuleName.SPACE),
-                    grammar_builder.rule_reference(
-                        RuleName.SINGLE_LINE_COMMENT
-                    ),
+                    rule_reference(RuleName.SPACE),
+                    rule_reference(RuleName.SINGLE_LINE_COMMENT),
                 ]
             )
         ),
@@ -684,15 +613,13 @@ def _build_parser_grammar() -> Grammar:
                     grammar_builder.sequence_expression(
                         [
                             grammar_builder.negative_lookahead_expression(
-                                grammar_builder.rule_reference(
-                                    RuleName.END_OF_LINE
-                                )
+                                rule_reference(RuleName.END_OF_LINE)
                             ),
                             grammar_builder.any_character_expression(),
                         ]
                     )
                 ),
-                grammar_builder.rule_reference(RuleName.END_OF_LINE),
+                rule_reference(RuleName.END_OF_LINE),
             ]
         ),
     )
@@ -700,7 +627,7 @@ def _build_parser_grammar() -> Grammar:
         RuleName.SPACE,
         grammar_builder.prioritized_choice_expression(
             [
-                grammar_builder.rule_reference(RuleName.END_OF_LINE),
+                rule_reference(RuleName.END_OF_LINE),
                 grammar_builder.single_quoted_literal_expression(' '),
                 grammar_builder.single_quoted_literal_expression('\t'),
             ]
@@ -734,76 +661,75 @@ def _build_parser_grammar() -> Grammar:
         len(
             extra_rule_names := [
                 rule_name
-                for rule_name in RuleName
+                for rule_name in _RULE_NAMES
                 if rule_name not in grammar_builder.rule_names
             ]
         )
         == 0
     ), extra_rule_names
-    assert (
-        len(
-            missing_expression_classes := [
-                cls
-                for cls in to_package_non_abstract_subclasses(Expression)  # type: ignore[type-abstract]
-                if cls.__name__ not in grammar_builder.rule_names
-            ]
-        )
-        == 0
-    ), missing_expression_classes
     return grammar_builder.build()
 
 
-PARSER_GRAMMAR: Final[Grammar] = _build_parser_grammar()
-assert (
-    len(
-        unsupported_classes := [
-            cls
-            for cls in to_package_non_abstract_subclasses(Expression)  # type: ignore[type-abstract]
-            if cls.__name__ not in PARSER_GRAMMAR.rule_names
-        ]
-    )
-    == 0
-), unsupported_classes
+if TYPE_CHECKING:
+    PARSER_GRAMMAR: Grammar
+
+
+def __getattr__(name: str, /) -> Any:
+    if name == 'PARSER_GRAMMAR':
+        return _build_parser_grammar()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def clear_parse_grammar_cache() -> None:
+    _parse_grammar_with_parser_grammar.cache_clear()
 
 
 def parse_grammar(
-    text: str, /, *, parser_grammar: Grammar = PARSER_GRAMMAR
+    text: str, /, *, parser_grammar: Grammar | None = None
 ) -> Grammar:
-    tree = parser_grammar.parse(text, starting_rule_name='Grammar')
-    grammar_builder = GrammarBuilder()
-    TreeToGrammarVisitor(grammar_builder).visit(tree)
-    return grammar_builder.build()
+    if parser_grammar is None:
+        return _parse_grammar_with_parser_grammar(text)
+    return _parse_grammar(text, parser_grammar)
 
 
 class MatchTreeVisitor:
     VISITOR_METHOD_PREFIX: ClassVar[str] = 'visit_'
 
+    _visitors: ClassVar[
+        Mapping[str, Callable[[MatchTreeVisitor, RuleMatch], None]]
+    ] = MappingProxyType({})
+
+    _RULE_MATCH_VISITOR_SIGNATURE: ClassVar[inspect.Signature] = (
+        inspect.Signature(
+            [
+                inspect.Parameter('self', inspect.Parameter.POSITIONAL_ONLY),
+                inspect.Parameter(
+                    'match',
+                    inspect.Parameter.POSITIONAL_ONLY,
+                    annotation=RuleMatch,
+                ),
+            ],
+            return_annotation=None,
+        )
+    )
+
     def visit(self, match: AnyMatch, /) -> None:
-        if isinstance(match, RuleMatch):
-            self._visit_rule_match(match)
-        else:
-            self._generic_visit(match)
+        visitors = self._visitors
+        matches_stack = [match]
+        while matches_stack:
+            match = matches_stack.pop()
+            if isinstance(match, RuleMatch):
+                visitor = visitors.get(match.rule_name)
+                if visitor is None:
+                    matches_stack.append(match.match)
+                else:
+                    visitor(self, match)
+            elif isinstance(match, MatchTree):
+                matches_stack.extend(reversed(match.children))
 
-    def _generic_visit(self, match: AnyMatch, /) -> None:
-        if isinstance(match, RuleMatch):
-            self.visit(match.match)
-            return
-        if not isinstance(match, MatchTree):
-            return
-        for child in match.children:
-            self.visit(child)
-
-    def _visit_rule_match(self, match: RuleMatch, /) -> None:
-        getattr(
-            self,
-            self.VISITOR_METHOD_PREFIX + match.rule_name,
-            self._generic_visit,
-        )(match)
+    __slots__ = ()
 
     def __init_subclass__(cls, /) -> None:
-        rule_match_visitor_signature = inspect.signature(
-            cls._visit_rule_match, eval_str=True
-        )
         invalid_visitors = [
             (name, signature)
             for name, field in vars(cls).items()
@@ -817,52 +743,117 @@ class MatchTreeVisitor:
                             else None
                         )
                     )
-                    != rule_match_visitor_signature
+                    != cls._RULE_MATCH_VISITOR_SIGNATURE
                 )
             )
         ]
         if len(invalid_visitors) > 0:
             raise ValueError(invalid_visitors)
+        cls._visitors = MappingProxyType(
+            {
+                **cls._visitors,
+                **{
+                    sys.intern(
+                        name.removeprefix(cls.VISITOR_METHOD_PREFIX)
+                    ): field
+                    for name, field in vars(cls).items()
+                    if name.startswith(cls.VISITOR_METHOD_PREFIX)
+                },
+            }
+        )
+
+
+def _to_unary_expression_visitor(
+    rule_name: str, build_expression: Callable[[GrammarBuilder, int], int], /
+) -> Callable[[TreeToGrammarVisitor, RuleMatch], None]:
+    def visit_unary_expression(self, match: RuleMatch, /) -> None:
+        with self._push_expression_builder_indices() as (
+            expression_builder_indices
+        ):
+            self.visit(match.match)
+        (expression_builder_index,) = expression_builder_indices
+        self._expression_builder_indices.append(
+            build_expression(self._grammar_builder, expression_builder_index)
+        )
+
+    visit_unary_expression.__name__ = name = (
+        MatchTreeVisitor.VISITOR_METHOD_PREFIX + rule_name
+    )
+    visit_unary_expression.__qualname__ = f'TreeToGrammarVisitor.{name}'
+    return visit_unary_expression
+
+
+def _to_variadic_expression_visitor(
+    rule_name: str,
+    build_expression: Callable[[GrammarBuilder, Sequence[int]], int],
+    /,
+) -> Callable[[TreeToGrammarVisitor, RuleMatch], None]:
+    def visit_variadic_expression(self, match: RuleMatch, /) -> None:
+        with self._push_expression_builder_indices() as (
+            expression_builder_indices
+        ):
+            self.visit(match.match)
+        self._expression_builder_indices.append(
+            build_expression(self._grammar_builder, expression_builder_indices)
+        )
+
+    visit_variadic_expression.__name__ = name = (
+        MatchTreeVisitor.VISITOR_METHOD_PREFIX + rule_name
+    )
+    visit_variadic_expression.__qualname__ = f'TreeToGrammarVisitor.{name}'
+    return visit_variadic_expression
 
 
 class TreeToGrammarVisitor(MatchTreeVisitor):
-    _COMMON_SPECIAL_CHARACTER_MAPPING: ClassVar[Mapping[str, str]] = {
-        ('\\' + character): (
-            ('\\' + character).encode('utf-8').decode('unicode-escape')
+    _COMMON_UNESCAPE_TRANSLATION_TABLE: ClassVar[Mapping[int, str]] = (
+        MappingProxyType(
+            {
+                ord(character): (
+                    ('\\' + character).encode('utf-8').decode('unicode-escape')
+                )
+                for character in COMMON_SPECIAL_CHARACTERS
+            }
         )
-        for character in COMMON_SPECIAL_CHARACTERS
-    }
-    _CHARACTER_CLASS_SPECIAL_CHARACTER_MAPPING: ClassVar[Mapping[str, str]] = {
-        **{
-            '\\' + character: character
-            for character in CHARACTER_CLASS_SPECIAL_CHARACTERS
-        },
-        **_COMMON_SPECIAL_CHARACTER_MAPPING,
-    }
-    _DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTER_MAPPING: ClassVar[
-        Mapping[str, str]
-    ] = {
-        **{
-            '\\' + character: character
-            for character in DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
-        },
-        **_COMMON_SPECIAL_CHARACTER_MAPPING,
-    }
-    _SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTER_MAPPING: ClassVar[
-        Mapping[str, str]
-    ] = {
-        **{
-            '\\' + character: character
-            for character in SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
-        },
-        **_COMMON_SPECIAL_CHARACTER_MAPPING,
-    }
+    )
+    _CHARACTER_CLASS_UNESCAPE_TRANSLATION_TABLE: ClassVar[
+        Mapping[int, str]
+    ] = MappingProxyType(
+        {
+            **{
+                ord(character): character
+                for character in CHARACTER_CLASS_SPECIAL_CHARACTERS
+            },
+            **_COMMON_UNESCAPE_TRANSLATION_TABLE,
+        }
+    )
+    _DOUBLE_QUOTED_LITERAL_UNESCAPE_TRANSLATION_TABLE: ClassVar[
+        Mapping[int, str]
+    ] = MappingProxyType(
+        {
+            **{
+                ord(character): character
+                for character in DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
+            },
+            **_COMMON_UNESCAPE_TRANSLATION_TABLE,
+        }
+    )
+    _SINGLE_QUOTED_LITERAL_UNESCAPE_TRANSLATION_TABLE: ClassVar[
+        Mapping[int, str]
+    ] = MappingProxyType(
+        {
+            **{
+                ord(character): character
+                for character in SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTERS
+            },
+            **_COMMON_UNESCAPE_TRANSLATION_TABLE,
+        }
+    )
 
     def visit_AnyCharacterExpression(  # noqa: N802
         self, match: RuleMatch, /
     ) -> None:
         self.visit(match.match)
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.any_character_expression()
         )
 
@@ -871,7 +862,7 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
     ) -> None:
         with self._push_character_class_elements() as character_class_elements:
             self.visit(match.match)
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.character_class_expression(
                 character_class_elements
             )
@@ -881,31 +872,31 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
         self, match: RuleMatch, /
     ) -> None:
         character = match.characters
-        character = self._CHARACTER_CLASS_SPECIAL_CHARACTER_MAPPING.get(
-            character, character
-        )
+        if len(character) == 2:
+            assert character[0] == '\\', character
+            character = character[1].translate(
+                self._CHARACTER_CLASS_UNESCAPE_TRANSLATION_TABLE
+            )
         assert len(character) == 1, character
-        self._character_class_characters[-1].append(character)
+        self._character_class_characters.append(character)
 
     def visit_CharacterRange(self, match: RuleMatch, /) -> None:  # noqa: N802
         with self._push_character_class_characters() as start_end:
             self.visit(match.match)
         start, end = start_end
-        self._character_class_elements[-1].append(CharacterRange(start, end))
+        self._character_class_elements.append(CharacterRange(start, end))
 
     def visit_CharacterSet(self, match: RuleMatch, /) -> None:  # noqa: N802
         with self._push_character_class_characters() as elements:
             self.visit(match.match)
-        self._character_class_elements[-1].append(
-            CharacterSet(''.join(elements))
-        )
+        self._character_class_elements.append(CharacterSet(''.join(elements)))
 
     def visit_ComplementedCharacterClassExpression(  # noqa: N802
         self, match: RuleMatch, /
     ) -> None:
         with self._push_character_class_elements() as character_class_elements:
             self.visit(match.match)
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.complemented_character_class_expression(
                 character_class_elements
             )
@@ -914,24 +905,15 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
     def visit_DoubleQuotedLiteralExpression(  # noqa: N802
         self, match: RuleMatch, /
     ) -> None:
-        with self._push_literal_characters() as characters:
-            self.visit(match.match)
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.double_quoted_literal_expression(
-                ''.join(characters)
+                _unescape_characters(
+                    _to_literal_body_characters(match),
+                    self._DOUBLE_QUOTED_LITERAL_UNESCAPE_TRANSLATION_TABLE,
+                )
             )
         )
 
-    def visit_DoubleQuotedLiteralExpressionCharacter(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        character = match.characters
-        character = self._DOUBLE_QUOTED_LITERAL_SPECIAL_CHARACTER_MAPPING.get(
-            character, character
-        )
-        assert len(character) == 1, character
-        self._literal_characters[-1].append(character)
-
     def visit_ExactRepetitionExpression(self, match: RuleMatch, /) -> None:
         with (
             self._push_expression_builder_indices() as (
@@ -942,7 +924,7 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
             self.visit(match.match)
         (expression_builder_index,) = expression_builder_indices
         (count,) = unsigned_integers
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.exact_repetition_expression(
                 expression_builder_index, count
             )
@@ -951,33 +933,14 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
     def visit_Identifier(self, match: RuleMatch, /) -> None:  # noqa: N802
         self._identifiers.append(match.characters)
 
-    def visit_NegativeLookaheadExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as (
-            expression_builder_indices
-        ):
-            self.visit(match.match)
-        (expression_builder_index,) = expression_builder_indices
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.negative_lookahead_expression(
-                expression_builder_index
-            )
-        )
+    visit_NegativeLookaheadExpression = _to_unary_expression_visitor(
+        RuleName.NEGATIVE_LOOKAHEAD,
+        GrammarBuilder.negative_lookahead_expression,
+    )
 
-    def visit_OneOrMoreExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as (
-            expression_builder_indices
-        ):
-            self.visit(match.match)
-        (expression_builder_index,) = expression_builder_indices
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.one_or_more_expression(
-                expression_builder_index
-            )
-        )
+    visit_OneOrMoreExpression = _to_unary_expression_visitor(
+        RuleName.ONE_OR_MORE, GrammarBuilder.one_or_more_expression
+    )
 
     def visit_PositiveOrMoreExpression(  # noqa: N802
         self, match: RuleMatch, /
@@ -991,7 +954,7 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
             self.visit(match.match)
         (expression_builder_index,) = expression_builder_indices
         (start,) = unsigned_integers
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.positive_or_more_expression(
                 expression_builder_index, start
             )
@@ -1009,50 +972,25 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
             self.visit(match.match)
         (expression_builder_index,) = expression_builder_indices
         start, end = unsigned_integers
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.positive_repetition_range_expression(
                 expression_builder_index, start, end
             )
         )
 
-    def visit_OptionalExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as (
-            expression_builder_indices
-        ):
-            self.visit(match.match)
-        (expression_builder_index,) = expression_builder_indices
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.optional_expression(expression_builder_index)
-        )
+    visit_OptionalExpression = _to_unary_expression_visitor(
+        RuleName.OPTIONAL, GrammarBuilder.optional_expression
+    )
 
-    def visit_PositiveLookaheadExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as (
-            expression_builder_indices
-        ):
-            self.visit(match.match)
-        (expression_builder_index,) = expression_builder_indices
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.positive_lookahead_expression(
-                expression_builder_index
-            )
-        )
+    visit_PositiveLookaheadExpression = _to_unary_expression_visitor(
+        RuleName.POSITIVE_LOOKAHEAD,
+        GrammarBuilder.positive_lookahead_expression,
+    )
 
-    def visit_PrioritizedChoiceExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with (
-            self._push_expression_builder_indices() as variant_builder_indices
-        ):
-            self.visit(match.match)
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.prioritized_choice_expression(
-                variant_builder_indices
-            )
-        )
+    visit_PrioritizedChoiceExpression = _to_variadic_expression_visitor(
+        RuleName.PRIORITIZED_CHOICE,
+        GrammarBuilder.prioritized_choice_expression,
+    )
 
     def visit_Rule(self, match: RuleMatch, /) -> None:  # noqa: N802
         with self._push_expression_builder_indices() as (
@@ -1066,58 +1004,34 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
     def visit_RuleReference(self, match: RuleMatch, /) -> None:  # noqa: N802
         self.visit(match.match)
         rule_name = self._identifiers.pop()
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.rule_reference(rule_name)
         )
 
-    def visit_SequenceExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as element_builders:
-            self.visit(match.match)
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.sequence_expression(element_builders)
-        )
+    visit_SequenceExpression = _to_variadic_expression_visitor(
+        RuleName.SEQUENCE, GrammarBuilder.sequence_expression
+    )
 
     def visit_SingleQuotedLiteralExpression(  # noqa: N802
         self, match: RuleMatch, /
     ) -> None:
-        with self._push_literal_characters() as characters:
-            self.visit(match.match)
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.single_quoted_literal_expression(
-                ''.join(characters)
+                _unescape_characters(
+                    _to_literal_body_characters(match),
+                    self._SINGLE_QUOTED_LITERAL_UNESCAPE_TRANSLATION_TABLE,
+                )
             )
         )
 
-    def visit_SingleQuotedLiteralExpressionCharacter(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        character = match.characters
-        character = self._SINGLE_QUOTED_LITERAL_SPECIAL_CHARACTER_MAPPING.get(
-            character, character
-        )
-        assert len(character) == 1, character
-        self._literal_characters[-1].append(character)
-
     def visit_UnsignedInteger(self, match: RuleMatch, /) -> None:  # noqa: N802
         value = int(match.characters)
         assert value >= 0, value
-        self._unsigned_integers[-1].append(value)
+        self._unsigned_integers.append(value)
 
-    def visit_ZeroOrMoreExpression(  # noqa: N802
-        self, match: RuleMatch, /
-    ) -> None:
-        with self._push_expression_builder_indices() as (
-            expression_builder_indices
-        ):
-            self.visit(match.match)
-        (expression_builder_index,) = expression_builder_indices
-        self._expression_builder_indices[-1].append(
-            self._grammar_builder.zero_or_more_expression(
-                expression_builder_index
-            )
-        )
+    visit_ZeroOrMoreExpression = _to_unary_expression_visitor(
+        RuleName.ZERO_OR_MORE, GrammarBuilder.zero_or_more_expression
+    )
 
     def visit_ZeroRepetitionRangeExpression(  # noqa: N802
         self, match: RuleMatch, /
@@ -1131,50 +1045,45 @@ class TreeToGrammarVisitor(MatchTreeVisitor):
             self.visit(match.match)
         (expression_builder_index,) = expression_builder_indices
         (end,) = unsigned_integers
-        self._expression_builder_indices[-1].append(
+        self._expression_builder_indices.append(
             self._grammar_builder.zero_repetition_range_expression(
                 expression_builder_index, end
             )
         )
 
-    @contextlib.contextmanager
-    def _push_character_class_characters(self, /) -> Iterator[list[str]]:
-        with _push_sublist(self._character_class_characters) as result:
-            yield result
+    def _push_character_class_characters(self, /) -> _ListFieldScope[str]:
+        return _ListFieldScope(self, '_character_class_characters')
 
-    @contextlib.contextmanager
     def _push_character_class_elements(
         self, /
-    ) -> Iterator[list[CharacterRange | CharacterSet]]:
-        with _push_sublist(self._character_class_elements) as result:
-            yield result
+    ) -> _ListFieldScope[CharacterRange | CharacterSet]:
+        return _ListFieldScope(self, '_character_class_elements')
 
-    @contextlib.contextmanager
-    def _push_expression_builder_indices(self, /) -> Iterator[list[int]]:
-        with _push_sublist(self._expression_builder_indices) as result:
-            yield result
+    def _push_expression_builder_indices(self, /) -> _ListFieldScope[int]:
+        return _ListFieldScope(self, '_expression_builder_indices')
 
-    @contextlib.contextmanager
-    def _push_literal_characters(self, /) -> Iterator[list[str]]:
-        with _push_sublist(self._literal_characters) as result:
-            yield result
+    def _push_unsigned_integers(self, /) -> _ListFieldScope[int]:
+        return _ListFieldScope(self, '_unsigned_integers')
 
-    @contextlib.contextmanager
-    def _push_unsigned_integers(self, /) -> Iterator[list[int]]:
-        with _push_sublist(self._unsigned_integers) as result:
-            yield result
+    __slots__ = (
+        '_character_class_characters',
+        '_character_class_elements',
+        '_expression_builder_indices',
+        '_grammar_builder',
+        '_identifiers',
+        '_unsigned_integers',
+    )
 
     def __init__(self, grammar_builder: GrammarBuilder, /) -> None:
         super().__init__()
-        self._character_class_characters: list[list[str]] = []
+        self._character_class_characters: list[str] = []
         self._character_class_elements: list[
-            list[CharacterRange | CharacterSet]
+            CharacterRange | CharacterSet
         ] = []
-        self._expression_builder_indices: list[list[int]] = []
+        self._expression_builder_indices: list[int] = []
         self._grammar_builder = grammar_builder
         self._identifiers: list[str] = []
-        self._literal_characters: list[list[str]] = []
-        self._unsigned_integers: list[list[int]] = []
+        self._unsigned_integers: list[int] = []
 
 
 assert (
@@ -1182,8 +1091,9 @@ assert (
         unsupported_classes := [
             cls
             for cls in to_package_non_abstract_subclasses(Expression)  # type: ignore[type-abstract]
-            if not callable(
-                getattr(TreeToGrammarVisitor, f'visit_{cls.__name__}', None)
+            if (
+                cls.__name__ not in _RULE_NAMES
+                or cls.__name__ not in TreeToGrammarVisitor._visitors
             )
         ]
     )
@@ -1192,32 +1102,101 @@ assert (
 assert (
     len(
         unexpected_visitors := [
-            name
-            for name, field in vars(TreeToGrammarVisitor).items()
-            if (
-                callable(field)
-                and name.startswith(TreeToGrammarVisitor.VISITOR_METHOD_PREFIX)
-                and (
-                    name.removeprefix(
-                        TreeToGrammarVisitor.VISITOR_METHOD_PREFIX
-                    )
-                    not in list(RuleName)
-                )
-            )
+            rule_name
+            for rule_name in TreeToGrammarVisitor._visitors
+            if rule_name not in _RULE_NAMES
         ]
     )
     == 0
 ), unexpected_visitors
+assert (
+    len(
+        misnamed_visitors := [
+            visitor
+            for rule_name, visitor in TreeToGrammarVisitor._visitors.items()
+            if visitor.__qualname__
+            != (
+                f'{TreeToGrammarVisitor.__qualname__}.'
+                f'{TreeToGrammarVisitor.VISITOR_METHOD_PREFIX}{rule_name}'
+            )
+        ]
+    )
+    == 0
+), misnamed_visitors
 
+_ESCAPE_SEQUENCE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r'\\(.)', re.DOTALL
+)
 _T = TypeVar('_T')
 
 
-@contextlib.contextmanager
-def _push_sublist(nested_list: list[list[_T]], /) -> Iterator[list[_T]]:
-    result: list[_T] = []
-    nested_list.append(result)
-    try:
-        yield result
-    finally:
-        last_expression_builders = nested_list.pop()
-        assert last_expression_builders is result
+@final
+class _ListFieldScope(Generic[_T]):
+    __slots__ = '_field_name', '_owner', '_previous', '_value'
+
+    def __init_subclass__(cls, /) -> None:
+        raise TypeError(
+            f'type {_ListFieldScope.__qualname__!r} '
+            'is not an acceptable base type'
+        )
+
+    def __new__(cls, owner: object, field_name: str, /) -> Self:
+        self = super().__new__(cls)
+        self._field_name, self._owner = field_name, owner
+        return self
+
+    def __enter__(self, /) -> list[_T]:
+        value: list[_T] = []
+        self._previous = getattr(self._owner, self._field_name)
+        self._value = value
+        setattr(self._owner, self._field_name, value)
+        return value
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        traceback: TracebackType | None,
+        /,
+    ) -> None:
+        assert getattr(self._owner, self._field_name) is self._value
+        setattr(self._owner, self._field_name, self._previous)
+
+    _field_name: str
+    _owner: object
+    _previous: list[_T]
+    _value: list[_T]
+
+
+def _parse_grammar(text: str, parser_grammar: Grammar, /) -> Grammar:
+    tree = parser_grammar.parse(text, starting_rule_name='Grammar')
+    grammar_builder = GrammarBuilder()
+    TreeToGrammarVisitor(grammar_builder).visit(tree)
+    return grammar_builder.build()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_grammar_with_parser_grammar(text: str, /) -> Grammar:
+    return _parse_grammar(text, _build_parser_grammar())
+
+
+def _to_literal_body_characters(match: RuleMatch, /) -> str:
+    literal_match = match.match
+    assert isinstance(literal_match, MatchTree), literal_match
+    body_match = literal_match.children[1]
+    return body_match.characters if isinstance(body_match, MatchTree) else ''
+
+
+def _unescape_characters(
+    value: str, translation_table: Mapping[int, str], /
+) -> str:
+    return (
+        _ESCAPE_SEQUENCE_PATTERN.sub(
+            lambda escape_sequence_match: escape_sequence_match[1].translate(
+                translation_table
+            ),
+            value,
+        )
+        if '\\' in value
+        else value
+    )
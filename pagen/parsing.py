@@ -1,3 +1,4 @@
 from . import _pagen as _module
 
+clear_parse_grammar_cache = _module.clear_parse_grammar_cache
 parse_grammar = _module.parse_grammar
@@ -0,0 +1,147 @@
+from collections.abc import Sequence
+
+import pytest
+
+from pagen.models import (
+    AnyCharacterExpression,
+    CharacterClassExpression,
+    CharacterRange,
+    CharacterSet,
+    ComplementedCharacterClassExpression,
+    Expression,
+    OptionalExpression,
+    PrioritizedChoiceExpression,
+    SequenceExpression,
+    SingleQuotedLiteralExpression,
+)
+
+CHARACTER_CLASS_CHARACTERS = [
+    *map(chr, [0, 1, 0x7F, 0x80, 0xFE, 0xFF, 0x100, 0x101, 0x3B1, 0xFFFF]),
+    *'\t\n -Zaz\U0001f600\U0010ffff',
+]
+
+
+@pytest.mark.parametrize(
+    'elements',
+    [
+        [CharacterRange('a', 'z')],
+        [CharacterRange('\xfe', '\u0101')],
+        [CharacterRange('\xff', '\u0100')],
+        [CharacterRange('\x00', '\U0010ffff')],
+        [CharacterRange('\u0100', '\uffff')],
+        [CharacterSet('\xff\u0100\u03b1')],
+        [CharacterSet('\U0001f600'), CharacterRange('\t', '\n')],
+        [CharacterRange('A', 'Z'), CharacterSet('-\x80\u0101')],
+    ],
+)
+def test_character_class_membership(
+    elements: Sequence[CharacterRange | CharacterSet],
+) -> None:
+    expression = CharacterClassExpression(elements)
+    complemented_expression = ComplementedCharacterClassExpression(elements)
+
+    for character in CHARACTER_CLASS_CHARACTERS:
+        is_member = any(character in element for element in elements)
+
+        assert (
+            expression.evaluate(character, 0, rules=[]).match is not None
+        ) is is_member, character
+        assert (
+            complemented_expression.evaluate(character, 0, rules=[]).match
+            is None
+        ) is is_member, character
+
+
+@pytest.mark.parametrize(
+    ('variants', 'variant_first_characters', 'texts'),
+    [
+        (
+            [
+                SingleQuotedLiteralExpression('a'),
+                SingleQuotedLiteralExpression('b'),
+                CharacterClassExpression([CharacterRange('x', 'z')]),
+            ],
+            [frozenset('a'), frozenset('b'), frozenset('xyz')],
+            ['', 'a', 'b', 'c', 'y'],
+        ),
+        (
+            [SingleQuotedLiteralExpression('a'), AnyCharacterExpression()],
+            [frozenset('a'), None],
+            ['', 'a', 'b'],
+        ),
+        (
+            [
+                SequenceExpression(
+                    [
+                        SingleQuotedLiteralExpression('a'),
+                        SingleQuotedLiteralExpression('b'),
+                    ]
+                ),
+                SequenceExpression(
+                    [
+                        AnyCharacterExpression(),
+                        SingleQuotedLiteralExpression('c'),
+                    ]
+                ),
+                SingleQuotedLiteralExpression('a'),
+            ],
+            [frozenset('a'), None, frozenset('a')],
+            ['', 'a', 'ab', 'ac', 'bc', 'x'],
+        ),
+        (
+            [
+                SingleQuotedLiteralExpression('a'),
+                OptionalExpression(SingleQuotedLiteralExpression('b')),
+            ],
+            [frozenset('a'), None],
+            ['', 'a', 'b', 'c'],
+        ),
+        (
+            [
+                CharacterClassExpression([CharacterRange('\xfe', '\u0101')]),
+                SingleQuotedLiteralExpression('\U0001f600'),
+                SingleQuotedLiteralExpression('a'),
+            ],
+            [
+                frozenset(map(chr, range(0xFE, 0x102))),
+                frozenset('\U0001f600'),
+                frozenset('a'),
+            ],
+            ['', 'a', '\xff', '\u0101', '\u0102', '\U0001f600'],
+        ),
+    ],
+)
+def test_prioritized_choice_dispatch(
+    variants: Sequence[Expression],
+    variant_first_characters: Sequence[frozenset[str] | None],
+    texts: Sequence[str],
+) -> None:
+    expression = PrioritizedChoiceExpression(
+        variants, variant_first_characters=variant_first_characters
+    )
+    non_dispatching_expression = PrioritizedChoiceExpression(variants)
+
+    assert expression == non_dispatching_expression
+    assert all(
+        repr(expression.evaluate(text, 0, rules=[]))
+        == repr(non_dispatching_expression.evaluate(text, 0, rules=[]))
+        for text in texts
+    )
+
+
+def test_prioritized_choice_without_dispatch() -> None:
+    variants = [
+        SingleQuotedLiteralExpression('a'),
+        SingleQuotedLiteralExpression('b'),
+    ]
+
+    expression = PrioritizedChoiceExpression(variants)
+
+    assert expression == PrioritizedChoiceExpression(
+        variants, variant_first_characters=[frozenset('a'), frozenset('b')]
+    )
+    assert all(
+        expression.evaluate(text, 0, rules=[]).match is not None
+        for text in ['a', 'b']
+    )
+    assert expression.evaluate('c', 0, rules=[]).match is None
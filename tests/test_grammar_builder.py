@@ -0,0 +1,43 @@
+import pytest
+
+from pagen._pagen import (
+    RuleReferenceBuilder,
+    SingleQuotedLiteralExpressionBuilder,
+)
+from pagen.models import Grammar, GrammarBuilder
+
+
+def test_defaults() -> None:
+    grammar_builder = GrammarBuilder(None, None, None)
+
+    assert grammar_builder.rule_names == []
+    assert repr(grammar_builder) == repr(GrammarBuilder())
+
+
+def test_explicit_lists() -> None:
+    grammar_builder = GrammarBuilder(
+        [
+            SingleQuotedLiteralExpressionBuilder('a'),
+            RuleReferenceBuilder('Item', 1),
+        ],
+        ['Start', 'Item'],
+        [1, 0],
+    )
+
+    assert grammar_builder.single_quoted_literal_expression('a') == 0
+    assert grammar_builder.rule_reference('Item') == 1
+    assert grammar_builder.rule_names == ['Start', 'Item']
+
+    grammar = grammar_builder.build()
+
+    assert isinstance(grammar, Grammar)
+    assert grammar.parse('a', starting_rule_name='Start').characters == 'a'
+
+
+@pytest.mark.parametrize('argument_index', range(3))
+def test_non_list_arguments(argument_index: int) -> None:
+    arguments: list[object] = [None, None, None]
+    arguments[argument_index] = ()
+
+    with pytest.raises(TypeError):
+        GrammarBuilder(*arguments)  # type: ignore[arg-type]
@@ -0,0 +1,70 @@
+from collections.abc import Callable
+from itertools import combinations
+
+import pytest
+
+from pagen._pagen.match import AnyMatch, RuleMatch
+from pagen.models import LookaheadMatch, MatchLeaf, MatchTree
+
+MATCH_FACTORIES: list[Callable[[], AnyMatch]] = [
+    LookaheadMatch,
+    lambda: MatchLeaf(characters='ab'),
+    lambda: MatchLeaf(characters='α'),
+    lambda: MatchTree(
+        children=[MatchLeaf(characters='a'), MatchLeaf(characters='b')]
+    ),
+    lambda: MatchTree(children=[MatchLeaf(characters='ab')]),
+    lambda: MatchTree(
+        children=[
+            MatchLeaf(characters='a'),
+            RuleMatch('Item', match=MatchLeaf(characters='b')),
+        ]
+    ),
+    lambda: RuleMatch('Start', match=LookaheadMatch()),
+    lambda: RuleMatch('Start', match=MatchLeaf(characters='ab')),
+    lambda: RuleMatch('Item', match=MatchLeaf(characters='ab')),
+    lambda: RuleMatch(
+        'Start',
+        match=MatchTree(
+            children=[
+                RuleMatch('Item', match=MatchLeaf(characters='a')),
+                RuleMatch('Item', match=MatchLeaf(characters='b')),
+            ]
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize('match_factory', MATCH_FACTORIES)
+def test_separately_built(match_factory: Callable[[], AnyMatch]) -> None:
+    match, other_match = match_factory(), match_factory()
+
+    assert match == other_match
+    assert hash(match) == hash(other_match)
+    assert len({match, other_match}) == 1
+
+
+@pytest.mark.parametrize(
+    ('match_factory', 'other_match_factory'),
+    list(combinations(MATCH_FACTORIES, 2)),
+)
+def test_different(
+    match_factory: Callable[[], AnyMatch],
+    other_match_factory: Callable[[], AnyMatch],
+) -> None:
+    match, other_match = match_factory(), other_match_factory()
+
+    assert match != other_match
+    assert other_match != match
+
+
+@pytest.mark.parametrize('characters', ['', 'a', '\n', '\xff'])
+def test_shared_leaves(characters: str) -> None:
+    assert MatchLeaf(characters=characters) is MatchLeaf(characters=characters)
+
+
+@pytest.mark.parametrize('characters', ['ab', 'Ā', 'α', '\U0001f600'])
+def test_unshared_leaves(characters: str) -> None:
+    assert MatchLeaf(characters=characters) is not MatchLeaf(
+        characters=characters
+    )
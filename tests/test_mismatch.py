@@ -0,0 +1,101 @@
+import pytest
+
+from pagen._pagen.mismatch import AnyMismatch
+from pagen.models import MismatchLeaf, MismatchTree
+
+
+def test_equal_values() -> None:
+    leaf = MismatchLeaf(
+        "'a'", expected_message="'a'", start_index=0, stop_index=1
+    )
+    tree = MismatchTree(
+        "'a' / 'b'",
+        children=[
+            leaf,
+            MismatchLeaf(
+                "'b'", expected_message="'b'", start_index=0, stop_index=1
+            ),
+        ],
+    )
+    same_leaf = MismatchLeaf(
+        "'a'", expected_message="'a'", start_index=0, stop_index=1
+    )
+    same_tree = MismatchTree(
+        "'a' / 'b'",
+        children=[
+            same_leaf,
+            MismatchLeaf(
+                "'b'", expected_message="'b'", start_index=0, stop_index=1
+            ),
+        ],
+    )
+
+    assert leaf == same_leaf
+    assert hash(leaf) == hash(same_leaf)
+    assert tree == same_tree
+    assert hash(tree) == hash(same_tree)
+    assert len({leaf, same_leaf, tree, same_tree}) == 2
+
+
+@pytest.mark.parametrize(
+    'other_mismatch',
+    [
+        MismatchLeaf(
+            "'b'", expected_message="'a'", start_index=0, stop_index=1
+        ),
+        MismatchLeaf(
+            "'a'", expected_message="'b'", start_index=0, stop_index=1
+        ),
+        MismatchLeaf(
+            "'a'", expected_message="'a'", start_index=1, stop_index=2
+        ),
+        MismatchLeaf(
+            "'a'", expected_message="'a'", start_index=0, stop_index=2
+        ),
+        MismatchTree(
+            "'a'",
+            children=[
+                MismatchLeaf(
+                    "'a'", expected_message="'a'", start_index=0, stop_index=1
+                )
+            ],
+        ),
+    ],
+)
+def test_different_leaf_values(other_mismatch: AnyMismatch) -> None:
+    mismatch = MismatchLeaf(
+        "'a'", expected_message="'a'", start_index=0, stop_index=1
+    )
+
+    assert mismatch != other_mismatch
+    assert other_mismatch != mismatch
+
+
+@pytest.mark.parametrize(
+    'other_children',
+    [
+        [
+            MismatchLeaf(
+                "'b'", expected_message="'b'", start_index=0, stop_index=1
+            )
+        ],
+        [
+            MismatchLeaf(
+                "'a'", expected_message="'a'", start_index=0, stop_index=1
+            ),
+            MismatchLeaf(
+                "'b'", expected_message="'b'", start_index=0, stop_index=1
+            ),
+        ],
+    ],
+)
+def test_different_tree_values(other_children: list[AnyMismatch]) -> None:
+    children: list[AnyMismatch] = [
+        MismatchLeaf(
+            "'a'", expected_message="'a'", start_index=0, stop_index=1
+        )
+    ]
+    mismatch = MismatchTree("'a'", children=children)
+
+    assert mismatch != MismatchTree("'b'", children=children)
+    assert mismatch != MismatchTree("'a'", children=other_children)
@@ -1,13 +1,85 @@
+import pytest
 from hypothesis import given
 
-from pagen.models import Grammar
-from pagen.parsing import parse_grammar
+from pagen.models import Grammar, GrammarBuilder
+from pagen.parsing import clear_parse_grammar_cache, parse_grammar
 
 from tests.strategies import grammar_strategy
 
+GRAMMAR_TEXT = "Start <- Item+\nItem <- 'a' / 'b'"
+
 
 @given(grammar_strategy)
 def test_round_trip(grammar: Grammar) -> None:
     round_tripped_grammar = parse_grammar(str(grammar))
 
     assert grammar == round_tripped_grammar
+
+
+def test_clear_parse_grammar_cache() -> None:
+    grammar = parse_grammar(GRAMMAR_TEXT)
+
+    clear_parse_grammar_cache()
+
+    assert parse_grammar(GRAMMAR_TEXT) is not grammar
+    assert parse_grammar(GRAMMAR_TEXT) == grammar
+
+
+def test_cached_rule_names() -> None:
+    rule_names = parse_grammar(GRAMMAR_TEXT).rule_names
+
+    assert isinstance(rule_names, tuple)
+    assert sorted(rule_names) == ['Item', 'Start']
+
+
+@pytest.mark.parametrize(
+    ('body', 'value'),
+    [
+        ('\\f', '\f'),
+        ('\\n', '\n'),
+        ('\\r', '\r'),
+        ('\\t', '\t'),
+        ('\\v', '\v'),
+        ('\\\\', '\\'),
+        ('\\n\\t', '\n\t'),
+        ('\\\\n', '\\n'),
+        ('\\\\\\\\', '\\\\'),
+        ('\\r\\n\\\\', '\r\n\\'),
+        ('a\\\\', 'a\\'),
+        ('a\\tb', 'a\tb'),
+        ('ab', 'ab'),
+    ],
+)
+@pytest.mark.parametrize('quote', ['"', "'"])
+def test_literal_unescaping(body: str, value: str, quote: str) -> None:
+    grammar_builder = GrammarBuilder()
+    grammar_builder.add_rule(
+        'Start',
+        (
+            grammar_builder.double_quoted_literal_expression
+            if quote == '"'
+            else grammar_builder.single_quoted_literal_expression
+        )(value),
+    )
+
+    assert parse_grammar(f'Start <- {quote}{body}{quote}') == (
+        grammar_builder.build()
+    )
+
+
+@pytest.mark.parametrize('quote', ['"', "'"])
+def test_quote_unescaping(quote: str) -> None:
+    body = f'\\{quote}\\\\\\{quote}'
+    grammar_builder = GrammarBuilder()
+    grammar_builder.add_rule(
+        'Start',
+        (
+            grammar_builder.double_quoted_literal_expression
+            if quote == '"'
+            else grammar_builder.single_quoted_literal_expression
+        )(f'{quote}\\{quote}'),
+    )
+
+    assert parse_grammar(f'Start <- {quote}{body}{quote}') == (
+        grammar_builder.build()
+    )